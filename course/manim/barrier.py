@@ -1,9 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 from manim import *
 
-TEXT_FONT_SIZE = 32
+from barrier_problem import g, grad_f, hess_f, jac_g, x0
+from contours import contour_mobject, contour_paths
+from ipm import primal_dual_ip
+from narration import NarratedScene
+
 LABEL_FONT_SIZE = 24
 
 config.max_files_cached = 200
@@ -12,120 +15,21 @@ config.max_files_cached = 200
 # Contour
 ##
 f = lambda x,y: (x-2)**4 + (x-2*y)**2
-xs = np.arange(0, 2, 0.001)
-zs = [[f(x,y) for x in xs] for y in xs]
-paths = plt.contour(xs, xs, zs, [0.3, 1, 2.5, 5, 9]).get_paths()
+paths = contour_paths(f, [0.3, 1, 2.5, 5, 9], [0, 2])
 
 ###
 # Optimization code
 ###
 
-# def f(x):
-#     return (x[0]-2)**4 + (x[0]-2*x[1])**2
-
-def g(x):
-    return x[0]**2 - x[1] + x[2]
-
-x0 = np.array([0.5, 1, 0.75])
-n_p = 3
-n_d = 1
-N = 16     # Number of iterations (empirically, this is enough for this problem and parameters)
 beta = 0.5     # Reduction factor
 rho = 10.0     # Around 5 for efficiency.
-eps = 1e-3    # Tolerance
-
-def update_newton_dir(x, mu, z, rho):
-    X = np.diag(x)
-    Z = np.diag(z)
-    e = np.ones((n_p,1))
-
-    grad = np.array([
-        [4*(x[0]-2)**3 + 2*(x[0]-2*x[1])],
-        [-4*(x[0]-2*x[1])],
-        [0]
-    ])
-    jac = np.array([[2*x[0], -1, 1]])  # jacobian of constraints
-    hess = np.array([                 # hessian of objective
-        [12*(x[0]-2)**2 + 2, -4, 0],
-        [-4, 8, 0],
-        [0, 0, 0]
-    ])
-
-    Nmatrix = np.block([
-        [-hess, jac.T,                np.identity(n_p)],
-        [jac,   np.zeros((n_d, n_d)), np.zeros((n_d, n_p))],
-        [Z,     np.zeros((n_p, n_d)),   X]
-    ])
-
-    Nrhs = -np.block([
-        [(mu*jac + z).T - grad],
-        [g(x)],
-        [X@Z@e - rho*e]
-    ])
-
-    d = np.linalg.solve(Nmatrix, Nrhs)
-
-    dx = d[:3]
-    dv = d[3]
-    du = d[4:]
-    return dx, dv, du
-
-def calculate_step_size(x, d):
-    a = 1-eps
-    for i in range(len(d)):
-        if d[i] < 0:
-            a = min(a, -x[i]/d[i])
-    return np.round(a, decimals=3)
-
-def primal_dual_ip(
-        rho
-    ):
-
-    x = np.zeros((N, n_p))
-    v = np.zeros((N, n_d))
-    u = np.zeros((N, n_p))
-
-    x[0,:] = x0
-    u[0,:] = rho / x0
-
-    for i in range(N-1):
-        if np.dot(n_p, rho) < eps:
-            break
-        dx, dv, du = update_newton_dir(x[i,:], v[i,:], u[i,:], rho)
-
-        alpha_p = calculate_step_size(x[i,:], dx)
-        alpha_d = calculate_step_size(u[i,:], du)
-
-        x[i+1,:] = x[i,:] + alpha_p*dx.T[0]
-        v[i+1,:] = v[i,:] + alpha_d*dv.T[0]
-        u[i+1,:] = u[i,:] + alpha_d*du.T[0]
-
-        rho *= beta
-
-    return x
-
-points = primal_dual_ip(rho)
+
+trajectory = primal_dual_ip(grad_f, hess_f, g, jac_g, x0, rho=rho, beta=beta, decimals=3)
+points = trajectory.x
 
 ################################################################
 
-class IPM(Scene):
-
-    def create_text(self, str):
-        """
-        Creates the text at the bottom left corner
-        """
-        text = Tex(str, font_size=TEXT_FONT_SIZE).to_corner(DL)
-        self.play(Write(text))
-        return text
-    
-    def replace_text(self, text_mobj, str, *, wait=1.5):
-        """
-        Transforms text_mobj to one with str, with some hardcoded settings
-        """
-        tmp = Tex(str, font_size=TEXT_FONT_SIZE).to_corner(DL)
-        self.play(Transform(text_mobj, tmp))
-        self.remove(tmp)
-        self.wait(wait)
+class IPM(NarratedScene, Scene):
 
     def construct(self):
         ###
@@ -183,20 +87,10 @@ class IPM(Scene):
         # viridis
         colors = [ManimColor.from_hex(h) for h in ["#1e9d88", "#35b779", "#6ccd59", "#b5de2c", "#fee727"]]
         for i_p in range(len(paths)):
-            vertices = paths[i_p].cleaned().vertices
-            c = ax.plot_parametric_curve(
-                lambda t: (
-                vertices[int(t),0],
-                vertices[int(t),1],
-                0
-            ), color=colors[i_p], t_range=(0, len(paths[i_p])-1, 1))
-
+            vertices, codes = paths[i_p]
+            c = contour_mobject(ax, vertices, codes, tolerance=1e-3, color=colors[i_p])
             contours.append(c)
 
-        # paths[2] includes a(n approximately) vertical line at x_1=2
-        # Couldn't figure out how to get rid of it, so I'm painting it over
-        contours.append(ax.plot_line_graph([2,2],[0,2], line_color=BLACK, add_vertex_dots=False))
-
         contours = VGroup(*contours)
         self.play(FadeIn(contours))
 
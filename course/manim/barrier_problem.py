@@ -0,0 +1,33 @@
+"""
+The problem of the IPM scene,
+
+    min (x_1-2)^4 + (x_1-2x_2)^2  s.t.  x_1^2 - x_2 + x_3 = 0,  x >= 0,
+
+with the slack x_3 of the constraint x_1^2 <= x_2, as the derivatives and
+starting point that primal_dual_ip takes. It does not import manim, so that
+ipm_sweep.py and its worker processes can use it without the scene.
+"""
+import numpy as np
+
+
+def grad_f(x):
+    return np.array([
+        4*(x[0]-2)**3 + 2*(x[0]-2*x[1]),
+        -4*(x[0]-2*x[1]),
+        0
+    ])
+
+def hess_f(x):
+    return np.array([
+        [12*(x[0]-2)**2 + 2, -4, 0],
+        [-4, 8, 0],
+        [0, 0, 0]
+    ])
+
+def g(x):
+    return np.array([x[0]**2 - x[1] + x[2]])
+
+def jac_g(x):
+    return np.array([[2*x[0], -1, 1]])  # jacobian of constraints
+
+x0 = np.array([0.5, 1, 0.75])
@@ -1,35 +1,117 @@
 import numpy as np
 from manim import *
 
-TEXT_FONT_SIZE = 32
+from bnb_problem import A, b, c, integer
+from branch_bound import branch_and_bound, find_node
+from cuts import cut_and_branch
+from narration import NarratedScene
+from polygons import clip_area, clip_sequence, polygon_mobject, polygon_vertices
+from tree_layout import fit_layout, parents_of, tidy_layout
+from tree_view import tree_mobject
+
 LABEL_FONT_SIZE = 24
 
 config.max_files_cached = 200
 
+###
+# Problem data and search trees
+###
+tree, stats = branch_and_bound(c, A, b, integer)
+tree_x2, stats_x2 = branch_and_bound(c, A, b, integer, branching=lambda search, node, candidates: candidates[-1])  # x_2 first
+
+# A random problem with 12 binary variables, to show how large trees get
+rng = np.random.default_rng(1)
+A_large = rng.integers(5, 40, (2, 12))
+b_large = A_large.sum(axis=1) // 2
+c_large = A_large.sum(axis=0) + rng.integers(0, 10, 12)
+tree_large, stats_large = branch_and_bound(c_large, A_large, b_large, np.ones(12, dtype=bool), [(0, 1)]*12)
+# The same problem with rounds of Gomory cuts at the root before branching
+tree_cut, stats_cut, cuts_cut = cut_and_branch(c_large, A_large, b_large, np.ones(12, dtype=bool), [(0, 1)]*12)
+
+# The feasible region within the plotted range as the constraints shown are
+# added one at a time, the last three rows of A and then the branch x_1 >= 9
+plot_box = polygon_vertices(np.zeros((0, 2)), [], upper=(12, 12))
+regions = clip_sequence(plot_box, np.vstack([A[[3, 2, 1]], [[-1, 0]]]), np.append(b[[3, 2, 1]], -9))
+
+def fmt(v, decimals=2):
+    """
+    Formats a number with at most the given decimals, e.g. 7.67, 4.8 or 9
+    """
+    return f"{round(v, decimals) + 0.0:.{decimals}f}".rstrip("0").rstrip(".")
+
+def point_tex(x):
+    return "(" + ",".join(fmt(v) for v in x) + ")"
+
+def branch_tex(node):
+    var, sense, value = node.branch
+    return rf"x_{var+1}\{'leq' if sense == '<=' else 'geq'} {fmt(value)}"
+
 def circleWithTex(str):
     c = Circle(radius=0.5)
     t = MathTex(str, font_size=32).move_to(c)
     return VGroup(c,t)
 
-
-class BNB(Scene):
-
-    def create_text(self, str):
+def node_group(name, node):
+    """
+    Creates the circle of a tree node with its solution to the left and objective value to the right
+    """
+    p = circleWithTex(name)
+    p_p = MathTex(f"x={point_tex(node.x)}", font_size=LABEL_FONT_SIZE)
+    p_o = MathTex(f"obj={fmt(node.obj, 1)}", font_size=LABEL_FONT_SIZE)
+    return VGroup(p_p, p, p_o).arrange(RIGHT)
+
+def place_node(group, point):
+    """
+    Moves a group of node_group so that its circle is at point
+    """
+    return group.shift(point - group[1].get_center())
+
+def objective_label(node, point, radius):
+    """
+    Creates a highlighted dot for a node of a large tree, with its objective value above
+    """
+    dot = Dot(point, radius=2*radius, color=YELLOW)
+    return VGroup(dot, MathTex(fmt(node.obj, 1), font_size=LABEL_FONT_SIZE).next_to(dot, UP, buff=0.1))
+
+def tree_edge(parent, child, node, scale=1):
+    """
+    Creates the arrow from parent to child and the label of the branch that led to node
+    """
+    arrow = Arrow(start=parent[1].get_bottom(), end=child[1].get_top(), buff=0.1)
+    side = LEFT if child[1].get_x() < parent[1].get_x() else RIGHT
+    label = MathTex(branch_tex(node), font_size=LABEL_FONT_SIZE*scale).next_to(arrow.get_center(), side, buff=0.15)
+    return arrow, label
+
+
+class BNB(NarratedScene, Scene):
+
+    def large_tree(self, log, stats, title):
         """
-        Creates the text at the bottom left corner
+        Draws a large tree below the title, labelling only the root and the optimal leaf, which is also returned.
         """
-        text = Tex(str, font_size=TEXT_FONT_SIZE).to_corner(DL)
-        self.play(Write(text))
-        return text
+        x, depth = tidy_layout(parents_of(log))
+        top = title.get_bottom()[1] - 0.2
+        bottom = -config.frame_height/2 + 0.8
+        points, _ = fit_layout(
+            x, depth, 1, 1, config.frame_width - 0.6, top - bottom, [0, (top + bottom) / 2, 0],
+            spacing=(1, 1), uniform=False
+        )
+        best = next(n for n in log if n.status == "integer" and n.obj == stats.obj)
+        return tree_mobject(log, points, radius=0.04, highlight=[0, best.id], label=objective_label), best
 
-    def replace_text(self, text_mobj, str, *, wait=1.5):
+    def tree_points(self, log, node_size, lp, title):
         """
-        Transforms text_mobj to one with str, with some hardcoded settings
+        Lays out the tree of log in the space left of lp and below title,
+        returning the points of its nodes and how much nodes of node_size
+        have to be scaled to fit
         """
-        tmp = Tex(str, font_size=TEXT_FONT_SIZE).to_corner(DL)
-        self.play(Transform(text_mobj, tmp))
-        self.remove(tmp)
-        self.wait(wait)
+        left = -config.frame_width/2 + 0.3
+        right = lp.get_left()[0] - 0.3
+        top = title.get_bottom()[1] - 0.2
+        bottom = -config.frame_height/2 + 0.8  # Room for the text
+        x, depth = tidy_layout(parents_of(log))
+        center = [(left + right) / 2, (top + bottom) / 2, 0]
+        return fit_layout(x, depth, *node_size, right - left, top - bottom, center, spacing=(1.1, 1.8))
 
     def construct(self):
         ###
@@ -93,12 +175,7 @@ class BNB(Scene):
         plane = VGroup(ax, labs).scale_to_fit_height(height).scale(0.95).to_edge(LEFT).shift(0.2*UP)
         self.play(Write(plane))
 
-        y_limit = ax.plot(lambda _: 12)
-        area = ax.get_area(
-            y_limit,
-            x_range=[0, 12],
-            opacity=0.5
-        )
+        area = polygon_mobject(ax, plot_box)
         self.play(DrawBorderThenFill(area))
         self.play(Restore(lp))
         ##
@@ -111,12 +188,7 @@ class BNB(Scene):
             color=BLUE
             )
         self.play(Create(c4))
-        temp = ax.get_area(
-            ax.plot(lambda x: 12 if x < 6 else 30-3*x),
-            x_range=[0,10],
-            opacity=0.5
-        )
-        self.play(Transform(area, temp))
+        clip_area(self, ax, area, regions[0])
         self.play(Restore(lp))
         ##
 
@@ -128,12 +200,7 @@ class BNB(Scene):
             color=BLUE
             )
         self.play(Create(c3))
-        temp = ax.get_area(
-            ax.plot(lambda x: np.min([(48-3*x)/5, 30-3*x])),
-            x_range=[0,10],
-            opacity=0.5
-        )
-        self.play(Transform(area, temp))
+        clip_area(self, ax, area, regions[1])
         self.play(Restore(lp))
         ##
 
@@ -145,12 +212,7 @@ class BNB(Scene):
             color=BLUE
             )
         self.play(Create(c2))
-        temp = ax.get_area(
-            ax.plot(lambda x: np.min([(63-3*x)/7, (48-3*x)/5, 30-3*x])),
-            x_range=[0,10],
-            opacity=0.5
-        )
-        self.play(Transform(area, temp))
+        clip_area(self, ax, area, regions[2])
         self.play(Restore(lp))
         ##
 
@@ -167,26 +229,21 @@ class BNB(Scene):
         ##
 
         ## Possible solutions
-        self.replace_text(text, "There are 5 possible optima.")
-        vertex_coords = [
-            [0,   0],
-            [10,  0],
-            [8.5, 4.5],
-            [3.5, 7.5],
-            [0,  9]
-        ]
+        vertex_coords = polygon_vertices(A, b)
+        self.replace_text(text, f"There are {len(vertex_coords)} possible optima.")
         dots = [Dot(c, color=RED) for c in ax.c2p(vertex_coords)]
+        i_opt = np.argmax(vertex_coords @ c)
         for dot in dots:
             self.play(Create(dot), Flash(dot))
         ##
 
         ## Highlight solution
         self.replace_text(text, "In fact, this one turns out to be the optimal solution.")
-        label = MathTex("(8.5,4.5)").next_to(dots[2], UP+RIGHT)
+        label = MathTex(point_tex(tree[0].x)).next_to(dots[i_opt], UP+RIGHT)
         self.play(
-            FadeOut(VGroup(*[d for i,d in enumerate(dots) if i!=2])),
+            FadeOut(VGroup(*[d for i,d in enumerate(dots) if i!=i_opt])),
             FadeIn(label),
-            Flash(dots[2])
+            Flash(dots[i_opt])
             )
         ##
 
@@ -216,19 +273,15 @@ class BNB(Scene):
             color=ORANGE
             )
         area.save_state()
-        temp = ax.get_area(
-            ax.plot(lambda x: 30-3*x),
-            x_range=[9,10],
-            opacity=0.5
-        )
-        self.play(FadeOut(dots[2], label))
+        self.play(FadeOut(dots[i_opt], label))
         self.play(Write(branch))
         self.play(Write(c_branch))
-        self.play(Transform(area, temp))
+        clip_area(self, ax, area, regions[3])
 
-        self.replace_text(text, "The new optimum is $(9,3)$, with objective value 141.")
-        dot_branch = Dot(ax.c2p([[9,3]]), color=RED)
-        label_branch = MathTex("(9,3)").next_to(dot_branch, LEFT)
+        n1 = find_node(tree, (0, ">="))
+        self.replace_text(text, f"The new optimum is ${point_tex(n1.x)}$, with objective value {fmt(n1.obj, 1)}.")
+        dot_branch = Dot(ax.c2p([n1.x]), color=RED)
+        label_branch = MathTex(point_tex(n1.x)).next_to(dot_branch, LEFT)
         branch_optim = VGroup(dot_branch, label_branch)
         self.play(FadeIn(branch_optim))
 
@@ -243,37 +296,48 @@ class BNB(Scene):
             plane, branch_optim, c2, c3, c4, c_branch, branch, text, area
         ))
 
+        ###
+        # Lay out the search tree
+        ###
+        n2 = find_node(tree, (0, "<="))
+        n3 = find_node(tree, (0, "<="), (1, "<="))
+        n4 = find_node(tree, (0, "<="), (1, ">="))
+        n5 = find_node(tree, (0, "<="), (1, ">="), (0, "<="))
+        n6 = find_node(tree, (0, "<="), (1, ">="), (0, "<="), (1, "<="))
+        n7 = find_node(tree, (0, "<="), (1, ">="), (0, "<="), (1, ">="))
+        n0 = tree[0]
+        node0, node1, node2, node3, node4, node5, node6, node7 = nodes = [
+            node_group(f"P_{i}", n) for i, n in enumerate((n0, n1, n2, n3, n4, n5, n6, n7))
+        ]
+        node_size = (max(g.width for g in nodes), max(g.height for g in nodes))
+        points, scale = self.tree_points(tree, node_size, lp, title)
+        for g, n in zip(nodes, (n0, n1, n2, n3, n4, n5, n6, n7)):
+            place_node(g.scale(scale), points[n.id])
+        (p0_p, p0, p0_o), (p1_p, p1, p1_o), (p2_p, p2, p2_o), (p3_p, p3, p3_o) = node0, node1, node2, node3
+        (p4_p, p4, p4_o), (p5_p, p5, p5_o), (p6_p, p6, p6_o), (p7_p, p7, p7_o) = node4, node5, node6, node7
+
         ###
         # Draw tree root
         ###
         text = self.create_text("Suppose we name the optimisation problem $P_0$, ignoring the integrality constraint.")
-        p0 = circleWithTex("P_0")
-        p0_p = MathTex("x=(8.5,4.5)", font_size=LABEL_FONT_SIZE).next_to(p0, UP)
-        p0_o = MathTex("obj=156.5", font_size=LABEL_FONT_SIZE).next_to(p0, DOWN)
-        node0 = VGroup(p0_p, p0, p0_o).arrange(DOWN).next_to(title, DOWN).to_edge(LEFT)
         self.play(FadeIn(p0))
         self.wait(3)
-        self.replace_text(text, "We know that the optimum of this problem is $(8.5,4,5)$.")
+        self.replace_text(text, f"We know that the optimum of this problem is ${point_tex(n0.x)}$.")
         self.play(FadeIn(p0_p))
-        self.replace_text(text, "And we can calculate its objective value as 156.5.")
+        self.replace_text(text, f"And we can calculate its objective value as {fmt(n0.obj, 1)}.")
         self.play(FadeIn(p0_o))
 
         ###
         # Branch on x_1, x_1 \geq 9
         ###
         self.replace_text(text, "Next, we branched on $x_1$, added a new constraint, and obtained a new problem $P_1$.")
-        p1 = circleWithTex("P_1")
-        p1_p = MathTex("x=(9,3)", font_size=LABEL_FONT_SIZE).next_to(p1, LEFT)
-        p1_o = MathTex("obj=141", font_size=LABEL_FONT_SIZE).next_to(p1, RIGHT)
-        node1 = VGroup(p1_p, p1, p1_o).arrange(DOWN).next_to(node0, 4*DOWN)
-        a_01 = Arrow(start=p0_o.get_center(), end=p1_p)
-        l_01 = MathTex(r"x_1\geq 9", font_size=LABEL_FONT_SIZE).next_to(a_01, RIGHT)
+        a_01, l_01 = tree_edge(node0, node1, n1, scale)
         self.play(Write(VGroup(a_01, l_01)), FadeIn(p1))
         
-        self.replace_text(text, "This problem has its optimum at $(9,3)$, which is feasible for our original problem.")
+        self.replace_text(text, f"This problem has its optimum at ${point_tex(n1.x)}$, which is feasible for our original problem.")
         self.play(FadeIn(p1_p))
         self.wait()
-        self.replace_text(text, "And the objective value is 141.")
+        self.replace_text(text, f"And the objective value is {fmt(n1.obj, 1)}.")
         self.play(FadeIn(p1_o))
         self.wait()
 
@@ -285,15 +349,10 @@ class BNB(Scene):
         ###
         self.replace_text(text, r"There is nothing in the original problem that requires $x_1\geq 9$.", wait=3)
         self.replace_text(text, r"So now, we need to explore the case of $x_1\leq 8$ as well.")
-        p2 = circleWithTex("P_2")
-        p2_p = MathTex("x=(8,4.8)", font_size=LABEL_FONT_SIZE).next_to(p2, UP)
-        p2_o = MathTex("obj=155.2", font_size=LABEL_FONT_SIZE).next_to(p2, DOWN)
-        node2 = VGroup(p2_p, p2, p2_o).arrange(DOWN).next_to(node0, 4*RIGHT)
-        a_02 = Arrow(start=p0, end=p2)
-        l_02 = MathTex(r"x_1\leq 8", font_size=LABEL_FONT_SIZE).next_to(a_02, UP)
+        a_02, l_02 = tree_edge(node0, node2, n2, scale)
         self.play(Write(VGroup(a_02, l_02)), FadeIn(p2))
 
-        self.replace_text(text, "The solution for this problem turns out to be $(8,4.8)$.")
+        self.replace_text(text, f"The solution for this problem turns out to be ${point_tex(n2.x)}$.")
         self.play(FadeIn(p2_p), FadeIn(p2_o))
         self.replace_text(text, "This is not a feasible solution for the original problem either, $x_2$ is not an integer.", wait=3)
         self.replace_text(text, "So we branch again.")
@@ -302,12 +361,7 @@ class BNB(Scene):
         # Branch on x_2, x_2 \leq 4
         ###
         self.replace_text(text, r"First, we do $x_2\leq 4$.")
-        p3 = circleWithTex("P_3")
-        p3_p = MathTex("x=(8,4)", font_size=LABEL_FONT_SIZE).next_to(p3, LEFT)
-        p3_o = MathTex("obj=144", font_size=LABEL_FONT_SIZE).next_to(p3, RIGHT)
-        node3 = VGroup(p3_p, p3, p3_o).arrange(DOWN).next_to(node2, 4*DOWN)
-        a_23 = Arrow(start=p2_o.get_center(), end=p3_p)
-        l_23 = MathTex(r"x_2\leq 4", font_size=LABEL_FONT_SIZE).next_to(a_23, RIGHT)
+        a_23, l_23 = tree_edge(node2, node3, n3, scale)
         self.play(Write(VGroup(a_23, l_23)), FadeIn(p3))
 
         self.play(FadeIn(p3_p), FadeIn(p3_o))
@@ -317,12 +371,7 @@ class BNB(Scene):
         # Branch on x_2, x_2 \geq 5
         ###
         self.replace_text(text, r"Now, we do $x_2\geq 5$.")
-        p4 = circleWithTex("P_4")
-        p4_p = MathTex("x=(7.67,5)", font_size=LABEL_FONT_SIZE).next_to(p4, UP)
-        p4_o = MathTex("obj=154.3", font_size=LABEL_FONT_SIZE).next_to(p4, DOWN)
-        node4 = VGroup(p4_p, p4, p4_o).arrange(DOWN).next_to(node2, 4*RIGHT)
-        a_24 = Arrow(start=p2, end=p4)
-        l_24 = MathTex(r"x_2\geq 5", font_size=LABEL_FONT_SIZE).next_to(a_24, UP)
+        a_24, l_24 = tree_edge(node2, node4, n4, scale)
         self.play(Write(VGroup(a_24, l_24)), FadeIn(p4))
         
         self.play(FadeIn(p4_p), FadeIn(p4_o))
@@ -348,12 +397,7 @@ class BNB(Scene):
         # Branch on x_1, x_1 \leq 7
         ###
         self.replace_text(text, r"We continue to $x_1\leq 7$.")
-        p5 = circleWithTex("P_5")
-        p5_p = MathTex("x=(7,5.4)", font_size=LABEL_FONT_SIZE).next_to(p5, UP)
-        p5_o = MathTex("obj=152.6", font_size=LABEL_FONT_SIZE).next_to(p5, DOWN)
-        node5 = VGroup(p5_p, p5, p5_o).arrange(DOWN).next_to(node4, 4*RIGHT)
-        a_45 = Arrow(start=p4, end=p5)
-        l_45 = MathTex(r"x_1\leq 7", font_size=LABEL_FONT_SIZE).next_to(a_45, UP)
+        a_45, l_45 = tree_edge(node4, node5, n5, scale)
         self.play(Write(VGroup(a_45, l_45)), FadeIn(p5))
         
         self.play(FadeIn(p5_p), FadeIn(p5_o))
@@ -362,12 +406,7 @@ class BNB(Scene):
         ###
         # Branch on x_2, x_2 \leq 5
         ###
-        p6 = circleWithTex("P_6")
-        p6_p = MathTex("x=(7,5)", font_size=LABEL_FONT_SIZE).next_to(p6, UP)
-        p6_o = MathTex("obj=147", font_size=LABEL_FONT_SIZE).next_to(p6, DOWN)
-        node6 = VGroup(p6_p, p6, p6_o).arrange(DOWN).next_to(node4, 4*DOWN)
-        a_56 = Line(start=p5.get_corner(DOWN+LEFT), end=p6.get_corner(UP+RIGHT)).add_tip(tip_length=0.15, tip_width=0.15)
-        l_56 = MathTex(r"x_2\leq 5", font_size=LABEL_FONT_SIZE).next_to(a_56, LEFT, buff=0)
+        a_56, l_56 = tree_edge(node5, node6, n6, scale)
         self.play(Write(VGroup(a_56, l_56)), FadeIn(p6))
         
         self.play(FadeIn(p6_p), FadeIn(p6_o))
@@ -375,12 +414,7 @@ class BNB(Scene):
         ###
         # Branch on x_2, x_2 \geq 6
         ###
-        p7 = circleWithTex("P_7")
-        p7_p = MathTex("x=(6,6)", font_size=LABEL_FONT_SIZE).next_to(p7, UP)
-        p7_o = MathTex("obj=150", font_size=LABEL_FONT_SIZE).next_to(p7, DOWN)
-        node7 = VGroup(p7_p, p7, p7_o).arrange(DOWN).next_to(node5, 4*DOWN)
-        a_57 = Arrow(start=p5_o.get_center(), end=p7_p)
-        l_57 = MathTex(r"x_2\geq 5", font_size=LABEL_FONT_SIZE).next_to(a_57, 0.8*RIGHT)
+        a_57, l_57 = tree_edge(node5, node7, n7, scale)
         self.play(Write(VGroup(a_57, l_57)), FadeIn(p7))
         
         self.play(FadeIn(p7_p), FadeIn(p7_o))
@@ -390,7 +424,7 @@ class BNB(Scene):
         ###
         self.replace_text(text, "We have reached a point where we cannot branch anymore.")
         self.replace_text(text, "All the leaf nodes are solutions to our original problem.", wait=3)
-        self.replace_text(text, "By comparing the objective values, we can observe that $x=(6,6)$ is the optimal solution to our MILP.")
+        self.replace_text(text, f"By comparing the objective values, we can observe that $x={point_tex(n7.x)}$ is the optimal solution to our MILP.")
         self.play(Circumscribe(node7))
 
         ###
@@ -405,26 +439,52 @@ class BNB(Scene):
             a_01, a_02, a_23, a_24, a_45, a_56, a_57,
             l_01, l_02, l_23, l_24, l_45, l_56, l_57
             )))
-        
+
+        # The subtree below x_2 >= 5 is the same as the one of P_4 before
+        reused = [
+            (node4, find_node(tree_x2, (1, ">="))),
+            (node5, find_node(tree_x2, (1, ">="), (0, "<="))),
+            (node6, find_node(tree_x2, (1, ">="), (0, "<="), (1, "<="))),
+            (node7, find_node(tree_x2, (1, ">="), (0, "<="), (1, ">="))),
+        ]
+        points_x2, scale_x2 = self.tree_points(tree_x2, node_size, lp, title)
+        node0.generate_target()
+        place_node(node0.target.scale(scale_x2 / scale), points_x2[0])
+        self.play(MoveToTarget(node0))
+        for g, n in reused:
+            place_node(g.scale(scale_x2 / scale), points_x2[n.id])
+        a_04, l_04 = tree_edge(node0, node4, reused[0][1], scale_x2)
+        a_45, l_45 = tree_edge(node4, node5, reused[1][1], scale_x2)
+        a_56, l_56 = tree_edge(node5, node6, reused[2][1], scale_x2)
+        a_57, l_57 = tree_edge(node5, node7, reused[3][1], scale_x2)
         reuse = Group(node4, node5, node6, node7, a_45, l_45, a_56, l_56, a_57, l_57)
-        Group(reuse, a_24, l_24).shift(p0.get_right()-a_24.get_left()+[0.25,0,0])
 
         self.replace_text(text, "If we were to start with $x_2\geq 5$, ...")
-        self.play(FadeIn(Group(a_24,l_24)))
+        self.play(FadeIn(Group(a_04, l_04)))
         self.replace_text(text, "... we would immediately find ourselves in the section containing the optimum.")
         self.play(FadeIn(reuse))
 
         self.replace_text(text, "We also need to explore the direction of $x_2\leq 4$.")
-        p8 = circleWithTex("P_8")
-        p8_p = MathTex("x=(8.5,4)", font_size=LABEL_FONT_SIZE).next_to(p8, UP)
-        p8_o = MathTex("obj=149.5", font_size=LABEL_FONT_SIZE).next_to(p8, DOWN)
-        node8 = VGroup(p8_p, p8, p8_o).arrange(DOWN).next_to(node0, 4*DOWN)
-        a_08 = Arrow(start=p0_o.get_center(), end=p8_p)
-        l_08 = MathTex(r"x_2\leq 4", font_size=LABEL_FONT_SIZE).next_to(a_08, RIGHT)
+        n8 = find_node(tree_x2, (1, "<="))
+        node8 = place_node(node_group("P_8", n8).scale(scale_x2), points_x2[n8.id])
+        a_08, l_08 = tree_edge(node0, node8, n8, scale_x2)
         self.play(Write(VGroup(a_08, l_08)), FadeIn(node8))
 
-        self.replace_text(text, "Since the objective value is smaller than that of $P_7$, we are done.")
-        self.replace_text(text, "Overall, our search tree is smaller than before.")
+        if n8.obj <= n7.obj:
+            self.replace_text(text, "Since the objective value is smaller than that of $P_7$, we are done.")
+        else:
+            children = [n for n in tree_x2 if n.parent == n8.id and n.x is not None]
+            self.replace_text(text, "Its objective value is larger than that of $P_7$, so a better solution could still be here.", wait=3)
+            self.replace_text(text, "Branching once more gives " + " and ".join(f"${point_tex(n.x)}$ with {fmt(n.obj, 1)}" for n in children) + ".", wait=3)
+            self.replace_text(text, "Neither beats $P_7$, so we are done.")
+
+        if stats_x2.lp_solves < stats.lp_solves:
+            comparison = "fewer than"
+        elif stats_x2.lp_solves == stats.lp_solves:
+            comparison = "as many as"
+        else:
+            comparison = "more than"
+        self.replace_text(text, f"Overall, we solved {stats_x2.lp_solves} problems this time, {comparison} the {stats.lp_solves} before.")
 
         ###
         # Ending note
@@ -433,5 +493,28 @@ class BNB(Scene):
         self.replace_text(text, "In larger problems with many variables, it is often unclear which variable to branch on and in which direction.")
         self.replace_text(text, "Consequently, the search trees often end up being very large, thus problems can take long times to be solved.")
 
+        ###
+        # A larger tree, only highlighted nodes are labelled
+        ###
+        self.play(FadeOut(Group(node0, node8, a_04, l_04, a_08, l_08, reuse, lp)))
+        self.replace_text(text, f"For example, a problem with 12 binary variables already gives a tree of {stats_large.nodes} nodes.")
+        large, best = self.large_tree(tree_large, stats_large, title)
+        edges, dots, _ = large
+        self.play(Create(edges), FadeIn(dots), run_time=3)
+        self.play(FadeIn(large.labels[0]))
+        self.replace_text(text, "Green nodes are integer solutions, grey ones were pruned and red ones were infeasible.", wait=3)
+        self.play(FadeIn(large.labels[best.id]), Flash(large.labels[best.id][0]))
+        self.replace_text(text, f"The optimum, with objective value {fmt(best.obj, 1)}, is just one of its leaves.", wait=3)
+
+        ###
+        # Cut-and-branch on the same problem
+        ###
+        self.replace_text(text, "Cutting planes can shrink the tree: inequalities that every integer solution satisfies, but the relaxation does not.")
+        self.replace_text(text, f"Adding {cuts_cut.cuts} Gomory cuts before branching tightens the bound at the root from {fmt(tree_large[0].obj, 1)} to {fmt(cuts_cut.root_bound, 1)}.")
+        cut, best_cut = self.large_tree(tree_cut, stats_cut, title)
+        self.play(FadeOut(large), FadeIn(cut))
+        self.play(Flash(cut.labels[best_cut.id][0]))
+        self.replace_text(text, f"The search then needs {stats_cut.nodes} nodes instead of {stats_large.nodes}, and finds the same optimum.", wait=3)
+
 
         self.wait(5)
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""
+Branch and bound with the LP relaxations of open nodes solved on a process pool.
+
+    python bnb_parallel.py --tsp 7 --processes 8 --out tsp7.npz
+    python bnb_parallel.py problem.npz --selection best_bound --out tree.npz
+
+computes the search tree of an integer program and writes it, as the arrays
+of its NodePool, to an npz file for a scene to draw. A problem file holds
+the arrays c, A, b and integer of branch_bound.py, and optionally lower and
+upper. --tsp instead builds the Miller-Tucker-Zemlin model of a random
+travelling salesperson problem with the given number of cities.
+"""
+import argparse
+import heapq
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from branch_bound import BRANCHINGS, SELECTIONS, BranchAndBound, Stats, solve_relaxation
+
+# Set in every worker by _init_worker
+_problem = None
+_incumbent = None
+
+
+def _init_worker(c, A, b, incumbent):
+    global _problem, _incumbent
+    _problem = (c, A, b)
+    _incumbent = incumbent
+
+
+def _solve(task):
+    """
+    Solves one relaxation in a worker, cut off at the incumbent broadcast by the main process.
+    """
+    lower, upper, basis = task
+    with _incumbent.get_lock():
+        cutoff = _incumbent.value
+    return solve_relaxation(*_problem, lower, upper, basis, None if np.isneginf(cutoff) else cutoff)
+
+
+class ParallelBranchAndBound(BranchAndBound):
+    """
+    A BranchAndBound that branches on up to batch open nodes at a time and
+    solves the relaxations of all their children on a process pool.
+
+    The children are stored as their relaxations come back, and the objective
+    of the incumbent is written to shared memory as soon as one of them
+    improves it. Every relaxation reads it when it starts, including those
+    of the same batch that are still queued, and stops as soon as it cannot
+    beat it, so workers do not finish solving nodes that are pruned anyway.
+    Nodes are selected and branched on in the main process, batch by batch,
+    and children are numbered in the order they are solved, so the tree can
+    differ from the one of a serial run, but the optimum is the same.
+    """
+
+    def __init__(self, *args, processes=None, batch=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.processes = processes or multiprocessing.cpu_count()
+        self.batch = batch or 4 * self.processes
+
+    def add_child(self, node, var, bounds, d, res, open_nodes, incumbent):
+        """
+        Stores child d of node, branched on var, with its solved relaxation
+        res, pushes it to open_nodes if it is open, and writes the objective
+        of the incumbent to the shared value incumbent for the workers.
+        """
+        f = node.x[var] - np.floor(node.x[var])
+        if res is not None and res[0] is not None:
+            self.pc_sum[d, var] += (node.obj - res[1]) / (f if d == 0 else 1-f)
+            self.pc_count[d, var] += 1
+        value = float(bounds[d][1][var] if d == 0 else bounds[d][0][var])
+        child = self.add(node.id, (var, ("<=", ">=")[d], value), res)
+        if child is not None:
+            heapq.heappush(open_nodes, (self.selection(self, child), child.id))
+        if self.incumbent is not None:
+            with incumbent.get_lock():
+                incumbent.value = self.incumbent.obj + self.tol
+
+    def run(self):
+        """
+        Explores the whole tree and returns its NodePool.
+        """
+        incumbent = multiprocessing.Value("d", -np.inf)
+        with ProcessPoolExecutor(self.processes, initializer=_init_worker,
+                                 initargs=(self.c, self.A, self.b, incumbent)) as pool:
+            open_nodes = []
+            root = self.add(None, None, self.solve(self.lower, self.upper))
+            if root is not None:
+                heapq.heappush(open_nodes, (self.selection(self, root), root.id))
+
+            while open_nodes:
+                # Branch on a batch of nodes in selection order
+                branched = []
+                while open_nodes and len(branched) < self.batch:
+                    _, i = heapq.heappop(open_nodes)
+                    node = self.open.pop(i)
+                    if self.incumbent is not None and node.obj <= self.incumbent.obj + self.tol:
+                        self.pool.set_status(i, "pruned")
+                        del self.bases[i]
+                        continue
+                    self.pool.set_status(i, "branched")
+                    var = int(self.branching(self, node, self.fractional(node.x)))
+                    bounds = self.child_bounds(node, var)
+                    branched.append((node, var, bounds, self.presolved.get((node.id, var))))
+                    self.presolved.clear()
+
+                # Children of strong branching are solved already, the others go to the pool
+                futures = {}
+                for node, var, bounds, presolved in branched:
+                    if presolved is None:
+                        basis = self.bases[node.id] if self.warm_start else None
+                        for d, child in enumerate(bounds):
+                            futures[pool.submit(_solve, (*child, basis))] = (node, var, bounds, d)
+                    else:
+                        for d, res in enumerate(presolved):
+                            self.add_child(node, var, bounds, d, res, open_nodes, incumbent)
+                    del self.bases[node.id]
+
+                # Children are stored as they are solved, so an incumbent found
+                # among them cuts off the relaxations that have not started yet
+                for future in as_completed(futures):
+                    res, pivots = future.result()
+                    self.lp_solves += 1
+                    self.pivots += pivots
+                    self.add_child(*futures[future], res, open_nodes, incumbent)
+
+        return self.pool
+
+
+def parallel_branch_and_bound(c, A, b, integer, bounds=None, *, processes=None, batch=None, keep_solutions=False, **kwargs):
+    """
+    Solves the integer program with ParallelBranchAndBound and returns its NodePool and Stats.
+
+    The remaining keyword arguments are those of branch_and_bound. Solutions
+    of the relaxations are only kept in search.solutions with keep_solutions.
+    """
+    search = ParallelBranchAndBound(c, A, b, integer, bounds, processes=processes, batch=batch, keep_solutions=keep_solutions, **kwargs)
+    start = time.perf_counter()
+    search.run()
+    elapsed = time.perf_counter() - start
+    best = search.incumbent
+    stats = Stats(len(search.pool), search.lp_solves, search.pivots, elapsed, None if best is None else best.obj, None if best is None else best.x)
+    return search.pool, stats
+
+
+def tsp_problem(n, seed=0):
+    """
+    Returns (c, A, b, integer, bounds) of the Miller-Tucker-Zemlin model of a
+    TSP on n random cities in the unit square, as a maximisation of the
+    negative tour length.
+
+    The variables are x_ij for i != j, 1 if the tour goes from i to j, followed
+    by the positions u_1..u_{n-1} of the cities other than city 0 in the tour.
+    """
+    rng = np.random.default_rng(seed)
+    cities = rng.random((n, 2))
+    arcs = [(i, j) for i in range(n) for j in range(n) if i != j]
+    n_x = len(arcs)
+    n_var = n_x + n - 1
+    dist = np.linalg.norm(cities[:, np.newaxis] - cities[np.newaxis, :], axis=-1)
+
+    c = np.zeros(n_var)
+    c[:n_x] = [-dist[i, j] for i, j in arcs]
+    rows = []
+    rhs = []
+    # Leave and enter every city exactly once, as pairs of inequalities
+    for k in range(n):
+        for side in (0, 1):
+            row = np.zeros(n_var)
+            row[[a for a, arc in enumerate(arcs) if arc[side] == k]] = 1
+            rows += [row, -row]
+            rhs += [1, -1]
+    # u_i - u_j + n x_ij <= n - 1 rules out subtours not through city 0
+    for a, (i, j) in enumerate(arcs):
+        if i == 0 or j == 0:
+            continue
+        row = np.zeros(n_var)
+        row[n_x + i - 1] = 1
+        row[n_x + j - 1] = -1
+        row[a] = n
+        rows.append(row)
+        rhs.append(n - 1)
+
+    integer = np.arange(n_var) < n_x
+    bounds = [(0, 1)] * n_x + [(1, n - 1)] * (n - 1)
+    return c, np.array(rows), np.array(rhs, dtype=float), integer, bounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("problem", nargs="?", help="npz file with c, A, b, integer and optionally lower and upper")
+    parser.add_argument("--tsp", type=int, help="solve a random TSP with this many cities instead")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--selection", choices=list(SELECTIONS), default="best_bound")
+    parser.add_argument("--branching", choices=list(BRANCHINGS), default="most_fractional")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--batch", type=int, default=None, help="nodes branched on per round (default 4 per process)")
+    parser.add_argument("--out", help="write the tree to this npz file")
+    args = parser.parse_args()
+
+    if args.tsp is not None:
+        c, A, b, integer, bounds = tsp_problem(args.tsp, args.seed)
+    elif args.problem is not None:
+        with np.load(args.problem) as data:
+            c, A, b, integer = data["c"], data["A"], data["b"], data["integer"]
+            lower = data["lower"] if "lower" in data else np.zeros(len(c))
+            upper = data["upper"] if "upper" in data else np.full(len(c), np.inf)
+        bounds = [(None if np.isneginf(l) else l, None if np.isposinf(u) else u) for l, u in zip(lower, upper)]
+    else:
+        parser.error("give a problem file or --tsp")
+
+    pool, stats = parallel_branch_and_bound(
+        c, A, b, integer, bounds,
+        selection=args.selection, branching=args.branching, processes=args.processes, batch=args.batch
+    )
+    print(f"{stats.nodes} nodes, {stats.lp_solves} LPs, {stats.pivots} pivots in {stats.time:.2f} s, objective {stats.obj}")
+
+    if args.out:
+        arrays = {name: getattr(pool, name)[:len(pool)] for name in pool.FIELDS}
+        if stats.x is not None:
+            arrays["x"] = stats.x
+        np.savez(args.out, **arrays)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""
+The problem of the BNB scene,
+
+    max 11 x_1 + 14 x_2  s.t.  A x <= b,  x >= 0,  x integer,
+
+as the data that branch_and_bound takes. It does not import manim, so that
+bnb_strategies.py can compare strategies on it without the scene.
+"""
+import numpy as np
+
+c = np.array([11, 14])
+A = np.array([
+    [1, 1],
+    [3, 7],
+    [3, 5],
+    [3, 1]
+])
+b = np.array([17, 63, 48, 30])
+integer = np.array([True, True])
@@ -0,0 +1,50 @@
+"""
+Compares branch-and-bound strategies on the problem of the BNB scene.
+
+    python bnb_strategies.py --selection dfs best_bound --branching most_fractional strong
+
+solves the problem with every combination of node selection and branching
+rule from branch_bound.py and prints the nodes explored, LP relaxations
+solved, simplex pivots and wall time of each, fewest nodes first. --cold
+solves every relaxation from scratch instead of from the parent's basis,
+and --csv also writes the table to a file.
+"""
+import argparse
+import csv
+
+from bnb_problem import A, b, c, integer
+from branch_bound import BRANCHINGS, SELECTIONS, compare_strategies
+
+COLUMNS = ["selection", "branching", "nodes", "lp_solves", "pivots", "time", "obj"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--selection", nargs="+", choices=list(SELECTIONS), default=list(SELECTIONS))
+    parser.add_argument("--branching", nargs="+", choices=list(BRANCHINGS), default=list(BRANCHINGS))
+    parser.add_argument("--cold", action="store_true", help="do not warm start relaxations from the parent's basis")
+    parser.add_argument("--csv", help="also write the table to this file")
+    args = parser.parse_args()
+
+    results = compare_strategies(c, A, b, integer, selections=args.selection, branchings=args.branching,
+                                 warm_start=not args.cold)
+    rows = [
+        {"selection": s, "branching": r, "nodes": st.nodes, "lp_solves": st.lp_solves, "pivots": st.pivots, "time": st.time, "obj": st.obj}
+        for (s, r), st in results.items()
+    ]
+    rows.sort(key=lambda r: (r["nodes"], r["lp_solves"]))
+
+    print(f"{'selection':>14} {'branching':>17} {'nodes':>6} {'LPs':>6} {'pivots':>7} {'time [s]':>9} {'obj':>10}")
+    for r in rows:
+        obj = "-" if r["obj"] is None else f"{r['obj']:g}"
+        print(f"{r['selection']:>14} {r['branching']:>17} {r['nodes']:>6} {r['lp_solves']:>6} {r['pivots']:>7} {r['time']:>9.4f} {obj:>10}")
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()
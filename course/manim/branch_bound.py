@@ -0,0 +1,451 @@
+"""
+LP-based branch and bound for small integer programs of the form
+
+    max c^T x  s.t.  A x <= b,  lower <= x <= upper,  x_j integer where integer[j]
+
+producing the log of the search tree that the BNB scene draws.
+
+The order in which open nodes are explored (SELECTIONS) and the variable
+branched on (BRANCHINGS) are pluggable, and every run reports how much
+work it took, so strategies can be compared with compare_strategies.
+
+Relaxations are solved with the dual simplex method. Every node keeps its
+optimal basis, and its children, which only differ by one bound, are
+re-solved starting from it. The tree itself is stored compactly in a
+NodePool, so that trees of 10^5 nodes fit comfortably in memory.
+"""
+import heapq
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from dual_simplex import dual_simplex
+
+Node = namedtuple("Node", ["id", "parent", "depth", "branch", "x", "obj", "status"])
+Node.__doc__ = """
+A node of the search tree. branch is the bound (var, sense, value) added to
+the parent's problem, with sense "<=" or ">=", and None at the root. x and
+obj are the solution and objective value of the LP relaxation, None if it
+is infeasible. status is one of "infeasible", "integer" (a feasible
+solution of the integer program), "pruned" (no better than the incumbent)
+or "branched".
+"""
+
+Stats = namedtuple("Stats", ["nodes", "lp_solves", "pivots", "time", "obj", "x"])
+Stats.__doc__ = """
+The effort of a run: nodes in the tree, LP relaxations solved (including
+those of strong branching), simplex pivots over all of them and wall time
+in seconds, along with the best integer solution found and its objective
+value (None if there is none).
+"""
+
+
+def solve_relaxation(c, A, b, lower, upper, basis=None, cutoff=None):
+    """
+    Solves the LP relaxation within the given bounds with the dual simplex
+    method, starting from basis if given. Returns (x, obj, basis) or None if
+    infeasible, and the number of pivots taken. If the objective is found to
+    be no more than cutoff before the solve ends, x and basis are None and
+    obj is that bound.
+    """
+    res = dual_simplex(c, A, b, lower, upper, basis, cutoff=cutoff)
+    if res.status == "infeasible":
+        return None, res.pivots
+    if res.status == "cutoff":
+        return (None, res.obj, None), res.pivots
+    if res.status != "optimal":
+        raise RuntimeError(f"LP relaxation could not be solved: {res.status}")
+    return (res.x, res.obj, res.basis), res.pivots
+
+
+###
+# Node selection: the open node with the smallest key is branched on next
+###
+
+def depth_first(search, node):
+    """
+    Deepest node first, and of two siblings the one with the better objective.
+    """
+    return (-node.depth, -node.obj, -node.id)
+
+def best_bound(search, node):
+    """
+    Node with the best objective first, which lowers the upper bound as fast as possible.
+    """
+    return (-node.obj, node.id)
+
+def best_estimate(search, node):
+    """
+    Node with the best integer objective estimated from pseudocosts first.
+    """
+    return (-search.estimate(node), node.id)
+
+SELECTIONS = {
+    "dfs": depth_first,
+    "best_bound": best_bound,
+    "best_estimate": best_estimate,
+}
+
+
+###
+# Branching: pick one of the fractional variables in candidates
+###
+
+def first_fractional(search, node, candidates):
+    """
+    The fractional variable with the lowest index.
+    """
+    return candidates[0]
+
+def most_fractional(search, node, candidates):
+    """
+    The variable whose fractional part is closest to 0.5.
+    """
+    f = node.x[candidates] - np.floor(node.x[candidates])
+    return candidates[np.argmin(np.abs(f - 0.5))]
+
+def pseudocost(search, node, candidates):
+    """
+    The variable with the best score of the objective losses predicted for
+    its children by the losses per unit change observed so far.
+    """
+    f = node.x[candidates] - np.floor(node.x[candidates])
+    down, up = search.pseudocosts(candidates)
+    return candidates[np.argmax(_score(f*down, (1-f)*up))]
+
+def strong(search, node, candidates):
+    """
+    The variable with the best score of the objective losses of its
+    children, found by solving both children of every candidate. The
+    relaxations of the chosen variable are reused for its children.
+    """
+    best, best_score = None, -np.inf
+    for var in candidates:
+        results = search.children(node, var)
+        losses = [node.obj - (res[1] if res is not None else -np.inf) for res in results]
+        score = _score(*losses)
+        if score > best_score:
+            best, best_score = var, score
+            search.presolved[node.id, var] = results
+    return best
+
+def _score(down, up, eps=1e-6):
+    """
+    Product score of the objective losses in the down and up children.
+    """
+    return np.maximum(down, eps) * np.maximum(up, eps)
+
+BRANCHINGS = {
+    "first_fractional": first_fractional,
+    "most_fractional": most_fractional,
+    "pseudocost": pseudocost,
+    "strong": strong,
+}
+
+
+class NodePool:
+    """
+    The search tree stored as a structure of arrays, a few dozen bytes per node.
+
+    A node only records what sets it apart from its parent: the variable
+    branched on, the sense of the new bound (-1 for <=, +1 for >=, 0 at the
+    root) and its value, along with its depth, the objective value of its
+    relaxation and its status, an index into STATUSES. The bounds of a node
+    are rebuilt by walking the chain of parents back to the root. The arrays
+    grow by doubling, so appending is amortized constant time.
+    """
+
+    STATUSES = (None, "infeasible", "integer", "pruned", "branched")
+    FIELDS = {
+        "parent": np.int32,
+        "var": np.int32,
+        "sense": np.int8,
+        "value": np.float64,
+        "depth": np.int32,
+        "obj": np.float64,
+        "status": np.int8,
+    }
+
+    def __init__(self, capacity=64):
+        self.size = 0
+        for name, dtype in self.FIELDS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name)[:self.size].nbytes for name in self.FIELDS)
+
+    def append(self, parent, branch, obj, status):
+        """
+        Stores a node and returns its id. branch is (var, sense, value) as in Node, or None at the root.
+        """
+        i = self.size
+        if i == len(self.parent):
+            for name in self.FIELDS:
+                setattr(self, name, np.resize(getattr(self, name), 2*i))
+        var, sense, value = (-1, None, np.nan) if branch is None else branch
+        self.parent[i] = -1 if parent is None else parent
+        self.var[i] = var
+        self.sense[i] = {None: 0, "<=": -1, ">=": 1}[sense]
+        self.value[i] = value
+        self.depth[i] = 0 if parent is None else self.depth[parent] + 1
+        self.obj[i] = np.nan if obj is None else obj
+        self.status[i] = self.STATUSES.index(status)
+        self.size += 1
+        return i
+
+    def set_status(self, i, status):
+        self.status[i] = self.STATUSES.index(status)
+
+    def chain(self, i):
+        """
+        Returns the ids of the nodes from i up to the root.
+        """
+        ids = []
+        while i >= 0:
+            ids.append(i)
+            i = self.parent[i]
+        return np.array(ids, dtype=int)
+
+    def bounds(self, i, lower, upper):
+        """
+        Returns the bounds of node i, given the bounds of the root.
+        """
+        ids = self.chain(i)[:-1]
+        lower = lower.copy()
+        upper = upper.copy()
+        # Bounds only tighten along the chain, so the tightest one is the one in force
+        down = ids[self.sense[ids] < 0]
+        np.minimum.at(upper, self.var[down], self.value[down])
+        up = ids[self.sense[ids] > 0]
+        np.maximum.at(lower, self.var[up], self.value[up])
+        return lower, upper
+
+    def node(self, i, x=None):
+        """
+        Returns node i as a Node, with the solution x of its relaxation if given.
+        """
+        parent = int(self.parent[i])
+        sense = self.sense[i]
+        branch = None if sense == 0 else (int(self.var[i]), "<=" if sense < 0 else ">=", float(self.value[i]))
+        obj = None if np.isnan(self.obj[i]) else float(self.obj[i])
+        return Node(i, None if parent < 0 else parent, int(self.depth[i]), branch, x, obj, self.STATUSES[self.status[i]])
+
+
+class BranchAndBound:
+    """
+    The state of a branch-and-bound run: the problem, the tree so far, the
+    incumbent, pseudocosts and counters.
+
+    selection and branching are names from SELECTIONS and BRANCHINGS or
+    functions with the same signature. With warm_start=False every
+    relaxation is solved from the slack basis instead of the parent's.
+
+    The tree is kept in a NodePool. Solutions and bases of relaxations are
+    only held while a node is open, unless keep_solutions is True, in which
+    case the solution of every node is kept for log.
+    """
+
+    def __init__(self, c, A, b, integer, bounds=None, *, selection="dfs", branching="first_fractional", warm_start=True, keep_solutions=False, tol=1e-6):
+        self.c = np.asarray(c, dtype=float)
+        self.A = np.asarray(A, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        self.integer = np.asarray(integer, dtype=bool)
+        if bounds is None:
+            bounds = [(0, None)] * len(self.c)
+        self.lower = np.array([-np.inf if l is None else l for l, _ in bounds], dtype=float)
+        self.upper = np.array([np.inf if u is None else u for _, u in bounds], dtype=float)
+        self.selection = SELECTIONS.get(selection, selection)
+        self.branching = BRANCHINGS.get(branching, branching)
+        self.warm_start = warm_start
+        self.keep_solutions = keep_solutions
+        self.tol = tol
+
+        self.pool = NodePool()
+        self.open = {}         # Open nodes by id
+        self.bases = {}        # Optimal bases of the open nodes
+        self.solutions = {}    # Solutions of all nodes, if keep_solutions
+        self.incumbent = None
+        self.lp_solves = 0
+        self.pivots = 0
+        self.presolved = {}    # Children solved while branching, by (node id, var)
+        n = len(self.c)
+        self.pc_sum = np.zeros((2, n))    # Objective losses per unit change, down and up
+        self.pc_count = np.zeros((2, n))
+
+    @property
+    def log(self):
+        """
+        The tree as a list of Nodes, with solutions where they are still known.
+        """
+        return [self.pool.node(i, self.solutions.get(i, self.open[i].x if i in self.open else None)) for i in range(len(self.pool))]
+
+    def solve(self, lower, upper, basis=None):
+        """
+        Solves a relaxation, counting it and its pivots.
+        """
+        self.lp_solves += 1
+        res, pivots = solve_relaxation(self.c, self.A, self.b, lower, upper, basis if self.warm_start else None)
+        self.pivots += pivots
+        return res
+
+    def fractional(self, x):
+        """
+        Returns the integer variables that are fractional in x.
+        """
+        return np.flatnonzero(self.integer & (x != np.round(x)))
+
+    def child_bounds(self, node, var):
+        """
+        Returns the bounds of the down and up children of node when branching on var.
+        """
+        lower, upper = self.pool.bounds(node.id, self.lower, self.upper)
+        u = upper.copy()
+        u[var] = np.floor(node.x[var])
+        l = lower.copy()
+        l[var] = np.ceil(node.x[var])
+        return (lower, u), (l, upper)
+
+    def children(self, node, var):
+        """
+        Solves the relaxations of the down and up children of node when
+        branching on var, starting from the optimal basis of node.
+        """
+        return [self.solve(*bounds, self.bases[node.id]) for bounds in self.child_bounds(node, var)]
+
+    def pseudocosts(self, candidates):
+        """
+        Returns the down and up pseudocosts of the candidates. Variables that
+        have not been branched on yet get the average over those that have.
+        """
+        observed = self.pc_count > 0
+        average = [
+            self.pc_sum[d, observed[d]].sum() / self.pc_count[d, observed[d]].sum() if observed[d].any() else 1.0
+            for d in range(2)
+        ]
+        pc = np.where(observed, self.pc_sum / np.maximum(self.pc_count, 1), np.array(average)[:, np.newaxis])
+        return pc[0, candidates], pc[1, candidates]
+
+    def estimate(self, node):
+        """
+        Estimates the best integer objective below node from the pseudocosts.
+        """
+        candidates = self.fractional(node.x)
+        f = node.x[candidates] - np.floor(node.x[candidates])
+        down, up = self.pseudocosts(candidates)
+        return node.obj - np.minimum(f*down, (1-f)*up).sum()
+
+    def add(self, parent, branch, res):
+        """
+        Stores a solved node and returns it if it is open, i.e. still needs branching.
+        """
+        if res is None:
+            self.pool.append(parent, branch, None, "infeasible")
+            return None
+        x, obj, basis = res
+        if x is None:
+            self.pool.append(parent, branch, obj, "pruned")  # Cut off by the incumbent
+            return None
+        x = np.where(self.integer & (np.abs(x - np.round(x)) <= self.tol), np.round(x), x)
+        if len(self.fractional(x)) == 0:
+            status = "integer"
+        elif self.incumbent is not None and obj <= self.incumbent.obj + self.tol:
+            status = "pruned"
+        else:
+            status = None  # Decided when the node is selected
+        i = self.pool.append(parent, branch, obj, status)
+        node = self.pool.node(i, x)
+        if self.keep_solutions:
+            self.solutions[i] = x
+        if status == "integer" and (self.incumbent is None or obj > self.incumbent.obj):
+            self.incumbent = node
+        if status is not None:
+            return None
+        self.open[i] = node
+        self.bases[i] = basis
+        return node
+
+    def run(self):
+        """
+        Explores the whole tree and returns its NodePool.
+        """
+        open_nodes = []
+        root = self.add(None, None, self.solve(self.lower, self.upper))
+        if root is not None:
+            heapq.heappush(open_nodes, (self.selection(self, root), root.id))
+
+        while open_nodes:
+            _, i = heapq.heappop(open_nodes)
+            node = self.open.pop(i)
+            if self.incumbent is not None and node.obj <= self.incumbent.obj + self.tol:
+                self.pool.set_status(i, "pruned")
+                del self.bases[i]
+                continue
+            self.pool.set_status(i, "branched")
+
+            var = int(self.branching(self, node, self.fractional(node.x)))
+            results = self.presolved.get((node.id, var)) or self.children(node, var)
+            self.presolved.clear()
+
+            f = node.x[var] - np.floor(node.x[var])
+            for d, (sense, bounds, res) in enumerate(zip(("<=", ">="), self.child_bounds(node, var), results)):
+                if res is not None and res[0] is not None:
+                    self.pc_sum[d, var] += (node.obj - res[1]) / (f if d == 0 else 1-f)
+                    self.pc_count[d, var] += 1
+                value = float(bounds[1][var] if d == 0 else bounds[0][var])
+                child = self.add(node.id, (var, sense, value), res)
+                if child is not None:
+                    heapq.heappush(open_nodes, (self.selection(self, child), child.id))
+            del self.bases[i]
+
+        return self.pool
+
+
+def branch_and_bound(c, A, b, integer, bounds=None, *, selection="dfs", branching="first_fractional", warm_start=True, tol=1e-6):
+    """
+    Solves the integer program and returns the log of its search tree as a list of Nodes, and its Stats.
+
+    bounds is a list of (lower, upper) pairs, with None for no bound, and
+    defaults to x >= 0. Whenever a node is branched on, the branching rule
+    picks one of its fractional integer variables and the LP relaxations of
+    both children are solved right away. The selection rule then decides
+    which open node to branch on next. The log lists the nodes in the order
+    they were solved, so a node's id is its position in the list. Children
+    are re-solved from their parent's optimal basis unless warm_start is False.
+
+    The log holds the solution of every node. For large trees, run a
+    BranchAndBound directly and work with its NodePool instead.
+    """
+    search = BranchAndBound(c, A, b, integer, bounds, selection=selection, branching=branching, warm_start=warm_start, keep_solutions=True, tol=tol)
+    start = time.perf_counter()
+    search.run()
+    elapsed = time.perf_counter() - start
+    best = search.incumbent
+    stats = Stats(len(search.pool), search.lp_solves, search.pivots, elapsed, None if best is None else best.obj, None if best is None else best.x)
+    return search.log, stats
+
+
+def compare_strategies(c, A, b, integer, bounds=None, *, selections=SELECTIONS, branchings=BRANCHINGS, **kwargs):
+    """
+    Runs branch_and_bound with every combination of selection and branching
+    rule and returns their Stats, keyed by (selection, branching).
+    """
+    return {
+        (s, r): branch_and_bound(c, A, b, integer, bounds, selection=s, branching=r, **kwargs)[1]
+        for s in selections
+        for r in branchings
+    }
+
+
+def find_node(log, *path):
+    """
+    Returns the node reached from the root by following path, a sequence of (var, sense) branches.
+    """
+    node = log[0]
+    for var, sense in path:
+        node = next(n for n in log if n.parent == node.id and n.branch[:2] == (var, sense))
+    return node
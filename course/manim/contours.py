@@ -0,0 +1,318 @@
+"""
+Helpers for drawing contour plots of objective functions in scenes.
+"""
+import hashlib
+import inspect
+import os
+from pathlib import Path
+
+import numpy as np
+
+from manim import VMobject, config
+
+CONTOUR_CACHE_SIZE = 64 * 2**20  # Bytes of cached contours kept in media/contours
+
+# Path codes, same values as matplotlib.path.Path
+MOVETO = 1
+LINETO = 2
+CLOSEPOLY = 79
+
+
+def adaptive_samples(fraction=1.0, oversample=1.0):
+    """
+    Returns the number of grid samples per axis that matches the render resolution.
+
+    fraction is the share of the frame width covered by the plot. A finer grid
+    cannot be told apart in the output, so previews rendered with -ql evaluate
+    far fewer points than final renders.
+    """
+    return max(2, int(np.ceil(config.pixel_width * fraction * oversample)))
+
+
+def evaluate_grid(f, x_range, y_range=None, *, step=None, samples=None):
+    """
+    Evaluates f(x, y) over a regular grid in a single broadcast call.
+
+    f has to accept NumPy arrays, which holds for any expression built from
+    arithmetic operators and NumPy functions. The grid is either given by a
+    step (as in np.arange) or by a number of samples per axis, defaulting to
+    adaptive_samples(). Returns xs, ys and zs with zs[i, j] = f(xs[j], ys[i]),
+    which is the layout contour functions expect.
+    """
+    if y_range is None:
+        y_range = x_range
+    if step is not None:
+        xs = np.arange(x_range[0], x_range[1], step)
+        ys = np.arange(y_range[0], y_range[1], step)
+    else:
+        if samples is None:
+            samples = adaptive_samples()
+        xs = np.linspace(x_range[0], x_range[1], samples)
+        ys = np.linspace(y_range[0], y_range[1], samples)
+
+    # Open grids broadcast to the full (len(ys), len(xs)) array inside f
+    zs = f(xs[np.newaxis, :], ys[:, np.newaxis])
+    zs = np.broadcast_to(zs, (len(ys), len(xs)))
+    return xs, ys, zs
+
+
+def iso_lines(xs, ys, zs, level):
+    """
+    Extracts the curve zs == level with marching squares.
+
+    The curve crosses an edge of the grid wherever the values at its two
+    endpoints lie on different sides of the level, and the crossing point is
+    found by linear interpolation. Each cell joins its crossings with one or,
+    for saddle cells, two segments, and the segments are stitched into
+    polylines, oriented so that larger values are on their left. Returns the
+    vertices as an (n, 2) array together with the path codes: each polyline
+    starts with MOVETO, and closed ones end by repeating their first vertex
+    with CLOSEPOLY.
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    zs = np.asarray(zs, dtype=float)
+    ny, nx = zs.shape
+    above = zs >= level
+
+    # Edges (i, j)-(i, j+1) get ids i*(nx-1)+j, edges (i, j)-(i+1, j) follow with n_h+i*nx+j
+    n_h = ny * (nx - 1)
+    h_cross = above[:, :-1] != above[:, 1:]
+    v_cross = above[:-1, :] != above[1:, :]
+
+    # Number of crossed edges of every cell, of which only the crossed cells are kept
+    count = (h_cross[:-1, :].astype(np.uint8) + v_cross[:, 1:] + h_cross[1:, :] + v_cross[:, :-1]).ravel()
+    cells = np.flatnonzero(count)
+    count = count[cells]
+    i, j = np.unravel_index(cells, (ny-1, nx-1))
+
+    # Edge ids of the crossed cells in the order bottom, right, top, left
+    edges = np.column_stack([
+        i*(nx-1) + j,
+        n_h + i*nx + j + 1,
+        (i+1)*(nx-1) + j,
+        n_h + i*nx + j
+    ])
+    crossed = np.column_stack([
+        h_cross[i, j],
+        v_cross[i, j+1],
+        h_cross[i+1, j],
+        v_cross[i, j]
+    ])
+
+    # Regular cells: join their two crossings
+    regular = count == 2
+    order = np.argsort(~crossed[regular], axis=1, kind="stable")[:, :2]
+    segments = [np.take_along_axis(edges[regular], order, axis=1)]
+
+    # Saddle cells: the value at the centre decides which pair of corners is cut off
+    saddle = count == 4
+    if np.any(saddle):
+        ci, cj = i[saddle], j[saddle]
+        centre = (zs[ci, cj] + zs[ci, cj+1] + zs[ci+1, cj] + zs[ci+1, cj+1]) / 4
+        joined = ((centre >= level) == above[ci, cj])[:, np.newaxis]
+        e = edges[saddle]
+        segments.append(np.where(joined, e[:, [0, 1]], e[:, [0, 3]]))
+        segments.append(np.where(joined, e[:, [2, 3]], e[:, [2, 1]]))
+    segments = np.concatenate(segments)
+
+    # Interpolate the crossing point on every edge that is used
+    ids = np.unique(segments)
+    points = np.zeros((len(ids), 2))
+    highs = np.zeros((len(ids), 2))  # Endpoint of the edge above the level
+    h = ids < n_h
+    ei, ej = np.divmod(ids[h], nx - 1)
+    t = (level - zs[ei, ej]) / (zs[ei, ej+1] - zs[ei, ej])
+    points[h] = np.column_stack([xs[ej] + t*(xs[ej+1] - xs[ej]), ys[ei]])
+    highs[h] = np.column_stack([np.where(above[ei, ej], xs[ej], xs[ej+1]), ys[ei]])
+    ei, ej = np.divmod(ids[~h] - n_h, nx)
+    t = (level - zs[ei, ej]) / (zs[ei+1, ej] - zs[ei, ej])
+    points[~h] = np.column_stack([xs[ej], ys[ei] + t*(ys[ei+1] - ys[ei])])
+    highs[~h] = np.column_stack([xs[ej], np.where(above[ei, ej], ys[ei], ys[ei+1])])
+    segments = np.searchsorted(ids, segments)
+
+    # Every crossing is shared by at most two cells, so each point has at most two neighbours
+    neighbours = [[-1, -1] for _ in range(len(points))]
+    degree = [0] * len(points)
+    for a, b in segments.tolist():
+        neighbours[a][degree[a]] = b
+        degree[a] += 1
+        neighbours[b][degree[b]] = a
+        degree[b] += 1
+
+    vertices = []
+    codes = []
+    visited = [False] * len(points)
+    # Open polylines start at points with a single neighbour, closed ones anywhere
+    starts = [p for p, d in enumerate(degree) if d == 1] + [p for p, d in enumerate(degree) if d == 2]
+    for start in starts:
+        if visited[start]:
+            continue
+        line = [start]
+        visited[start] = True
+        prev, cur = -1, start
+        while True:
+            nxt = neighbours[cur][0] if neighbours[cur][0] != prev else neighbours[cur][1]
+            if nxt == -1 or visited[nxt]:
+                break
+            line.append(nxt)
+            visited[nxt] = True
+            prev, cur = cur, nxt
+        # Like matplotlib, keep the values above the level on the left
+        if len(line) > 1:
+            d = points[line[1]] - points[line[0]]
+            u = highs[line[0]] - points[line[0]]
+            if d[0]*u[1] - d[1]*u[0] < 0:
+                line.reverse()
+        closed = degree[start] == 2 and len(line) > 2
+        vertices.append(points[line])
+        codes.append(np.full(len(line), LINETO))
+        codes[-1][0] = MOVETO
+        if closed:
+            vertices.append(points[line[:1]])
+            codes.append(np.array([CLOSEPOLY]))
+
+    if not vertices:
+        return np.zeros((0, 2)), np.zeros(0, dtype=np.uint8)
+    return np.concatenate(vertices), np.concatenate(codes).astype(np.uint8)
+
+
+def simplify(vertices, tolerance):
+    """
+    Drops the vertices of a polyline that are within tolerance of it, using Douglas-Peucker.
+
+    The first and last vertex are always kept. Each step splits a stretch of
+    the polyline at the vertex furthest from its chord, with the distances of
+    the whole stretch computed at once.
+    """
+    vertices = np.asarray(vertices)
+    keep = np.zeros(len(vertices), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(vertices) - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        chord = vertices[b] - vertices[a]
+        rel = vertices[a+1:b] - vertices[a]
+        length = np.hypot(*chord)
+        if length == 0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(chord[0]*rel[:, 1] - chord[1]*rel[:, 0]) / length
+        k = a + 1 + np.argmax(dist)
+        if dist[k - a - 1] > tolerance:
+            keep[k] = True
+            stack.append((a, k))
+            stack.append((k, b))
+    return vertices[keep]
+
+
+def split_components(vertices, codes):
+    """
+    Splits a path into its connected components, which start at MOVETO codes.
+
+    A component closed by CLOSEPOLY ends with its first vertex, so it can be
+    drawn as a plain polyline.
+    """
+    codes = np.asarray(codes)
+    starts = np.flatnonzero(codes == MOVETO)[1:]
+    parts = []
+    for part, part_codes in zip(np.split(vertices, starts), np.split(codes, starts)):
+        if part_codes[-1] == CLOSEPOLY:
+            part = part.copy()
+            part[-1] = part[0]
+        parts.append(part)
+    return parts
+
+
+def contour_mobject(ax, vertices, codes=None, *, tolerance=0, **kwargs):
+    """
+    Creates a polyline through vertices, given in the coordinates of ax.
+
+    Given path codes, every component becomes a separate subpath of the same
+    VMobject, instead of being joined to the next one by a stray line. The
+    points of each component are placed at once with set_points_as_corners.
+    With a positive tolerance (in the units of ax) the vertices are first
+    thinned out with simplify, which typically removes most of them on dense
+    contours without a visible difference. Remaining keyword arguments go to
+    VMobject.
+    """
+    parts = [vertices] if codes is None else split_components(vertices, codes)
+    points = []
+    for part in parts:
+        if len(part) < 2:
+            continue
+        if tolerance > 0:
+            part = simplify(part, tolerance)
+        points.append(VMobject().set_points_as_corners(ax.c2p(part)).points)
+    mobj = VMobject(**kwargs)
+    if points:
+        mobj.set_points(np.concatenate(points))
+    return mobj
+
+
+def _source(f):
+    """
+    Returns the source code of f, falling back to its bytecode for functions
+    defined interactively.
+    """
+    try:
+        return inspect.getsource(f)
+    except (OSError, TypeError):
+        return f.__code__.co_code.hex() + repr(f.__code__.co_consts)
+
+
+def _evict(cache_dir, max_size):
+    """
+    Deletes the least recently used cache files until the directory fits in max_size bytes.
+    """
+    files = sorted(cache_dir.glob("*.npz"), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in files)
+    for p in files:
+        if total <= max_size:
+            break
+        total -= p.stat().st_size
+        p.unlink()
+
+
+def contour_paths(f, levels, x_range, y_range=None, *, samples=None):
+    """
+    Returns the contour lines of f as one (vertices, codes) pair per level.
+
+    The lines are extracted with iso_lines and stored in media/contours under
+    a hash of the source of f, the grid and the levels, so later renders of an
+    unchanged scene load them instead of contouring again. Changing f, the
+    grid or the levels gives a new key, and the least recently used entries
+    are evicted once the cache exceeds CONTOUR_CACHE_SIZE.
+    """
+    if y_range is None:
+        y_range = x_range
+    if samples is None:
+        samples = adaptive_samples()
+
+    spec = ("iso_lines", _source(f), tuple(x_range), tuple(y_range), samples, tuple(levels))
+    key = hashlib.sha256(repr(spec).encode()).hexdigest()[:20]
+    cache_dir = Path(config.media_dir) / "contours"
+    file = cache_dir / f"{key}.npz"
+
+    if file.exists():
+        with np.load(file) as data:
+            paths = [(data[f"vertices_{i}"], data[f"codes_{i}"]) for i in range(len(levels))]
+        os.utime(file)  # Mark as recently used
+        return paths
+
+    xs, ys, zs = evaluate_grid(f, x_range, y_range, samples=samples)
+    paths = [iso_lines(xs, ys, zs, level) for level in levels]
+
+    arrays = {}
+    for i, (vertices, codes) in enumerate(paths):
+        arrays[f"vertices_{i}"] = vertices
+        arrays[f"codes_{i}"] = codes
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = file.with_suffix(".tmp")
+    with open(tmp, "wb") as fh:
+        np.savez(fh, **arrays)
+    os.replace(tmp, file)
+    _evict(cache_dir, CONTOUR_CACHE_SIZE)
+    return paths
@@ -0,0 +1,253 @@
+"""
+Linear programs from the course notes, as data for the simplex solvers.
+
+Every instance is an LP namedtuple describing
+
+    max c^T x  s.t.  A_ub x <= b_ub,  A_eq x = b_eq,  lower <= x <= upper
+
+with bounds given as (lower, upper) pairs where None means unbounded, like
+those of branch_bound.py, and names the TeX names of the variables.
+INSTANCES maps the name of every instance to the function building it.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+LP = namedtuple("LP", ["c", "A_ub", "b_ub", "A_eq", "b_eq", "bounds", "names"])
+
+
+def giapetto():
+    """
+    The two-variable problem of the SimplexGiapetto scene.
+    """
+    c = np.array([3., 2.])
+    A_ub = np.array([
+        [2., 1.],
+        [1., 1.],
+        [1., 0.]
+    ])
+    b_ub = np.array([100., 80., 40.])
+    return LP(c, A_ub, b_ub, np.zeros((0, 2)), np.zeros(0), [(0, None)] * 2, ["x_1", "x_2"])
+
+
+def food_manufacture():
+    """
+    The food manufacture problem of the LP examples (part 1, lecture 4):
+    buying, storing and blending five oils over six months.
+
+    The variables are the purchases b_ij, the amounts used u_ij and the
+    stocks s_ij of oil i at the end of month j, followed by the production
+    p_j. The final stocks are fixed to 500 tons by their bounds.
+    """
+    prices = np.array([
+        [110, 120, 130, 110, 115],
+        [130, 130, 110, 90, 115],
+        [110, 140, 130, 100, 95],
+        [120, 110, 120, 120, 125],
+        [100, 120, 150, 110, 105],
+        [90, 100, 140, 80, 135],  # As in the complete model, the table of the notes says 95
+    ], dtype=float)
+    hardness = np.array([8.8, 6.1, 2.0, 4.2, 5.0])
+    vegetable = np.array([True, True, False, False, False])
+    I, J = 5, 6
+    n = 3*I*J + J
+    buy = lambda i, j: i*J + j
+    use = lambda i, j: I*J + i*J + j
+    stock = lambda i, j: 2*I*J + i*J + j
+    product = lambda j: 3*I*J + j
+
+    c = np.zeros(n)
+    for i in range(I):
+        for j in range(J):
+            c[buy(i, j)] = -prices[j, i]
+            c[stock(i, j)] = -5
+    for j in range(J):
+        c[product(j)] = 150
+
+    A_ub, b_ub, A_eq, b_eq = [], [], [], []
+    for j in range(J):
+        # Refining capacity, and hardness between 3 and 6
+        for kind, limit in ((vegetable, 200), (~vegetable, 250)):
+            row = np.zeros(n)
+            row[[use(i, j) for i in range(I) if kind[i]]] = 1
+            A_ub.append(row)
+            b_ub.append(limit)
+        for limit, sign in ((6, 1), (3, -1)):
+            row = np.zeros(n)
+            row[[use(i, j) for i in range(I)]] = sign * hardness
+            row[product(j)] = -sign * limit
+            A_ub.append(row)
+            b_ub.append(0)
+        # Production is the sum of the oils used
+        row = np.zeros(n)
+        row[[use(i, j) for i in range(I)]] = 1
+        row[product(j)] = -1
+        A_eq.append(row)
+        b_eq.append(0)
+    # Stocks carry over from month to month, starting from 500 tons
+    for i in range(I):
+        for j in range(J):
+            row = np.zeros(n)
+            row[[buy(i, j), stock(i, j), use(i, j)]] = [1, -1, -1]
+            if j > 0:
+                row[stock(i, j-1)] = 1
+            A_eq.append(row)
+            b_eq.append(-500 if j == 0 else 0)
+
+    bounds = [(0, None)] * n
+    for i in range(I):
+        for j in range(J):
+            bounds[stock(i, j)] = (500, 500) if j == J-1 else (0, 1000)
+    names = [f"{v}_{{{i+1}{j+1}}}" for v in "bus" for i in range(I) for j in range(J)] + [f"p_{j+1}" for j in range(J)]
+    return LP(c, np.array(A_ub), np.array(b_ub, dtype=float), np.array(A_eq), np.array(b_eq, dtype=float), bounds, names)
+
+
+def factory_planning():
+    """
+    The factory planning problem of the LP examples (part 1, lecture 6):
+    manufacturing, holding and selling seven products over six months.
+
+    The variables are the amounts manufactured m_ij, held h_ij and sold s_ij
+    of product i in month j, in that order.
+    """
+    profit = np.array([10, 6, 8, 4, 11, 9, 3], dtype=float)
+    machine_usage = np.array([
+        [0.5, 0.7, 0, 0, 0.3, 0.2, 0.5],
+        [0.1, 0.2, 0, 0.3, 0, 0.6, 0],
+        [0.2, 0, 0.8, 0, 0, 0, 0.6],
+        [0.05, 0.03, 0, 0.07, 0.1, 0, 0.08],
+        [0, 0, 0.01, 0, 0.05, 0, 0.05],
+    ])
+    n_machines = np.array([4, 2, 3, 1, 1])
+    maintenance = np.array([
+        [1, 0, 0, 0, 0],
+        [0, 0, 2, 0, 0],
+        [0, 0, 0, 1, 0],
+        [0, 1, 0, 0, 0],
+        [1, 1, 0, 0, 0],
+        [0, 0, 1, 0, 1],
+    ])
+    market_limits = np.array([
+        [500, 1000, 300, 300, 800, 200, 100],
+        [600, 500, 200, 0, 400, 300, 150],
+        [300, 600, 0, 0, 500, 400, 100],
+        [200, 300, 400, 500, 200, 0, 100],
+        [0, 100, 500, 100, 1000, 300, 0],
+        [500, 500, 100, 300, 1100, 500, 60],
+    ])
+    holding_cost, holding_limit, holding_target = 0.5, 100, 50
+    hours = 24 * 2 * 8
+    I, J = 7, 6
+    n = 3*I*J
+    make = lambda i, j: i*J + j
+    hold = lambda i, j: I*J + i*J + j
+    sell = lambda i, j: 2*I*J + i*J + j
+
+    c = np.zeros(n)
+    for i in range(I):
+        for j in range(J):
+            c[sell(i, j)] = profit[i]
+            c[hold(i, j)] = -holding_cost
+
+    A_ub, b_ub, A_eq, b_eq = [], [], [], []
+    for j in range(J):
+        for k in range(len(n_machines)):
+            row = np.zeros(n)
+            row[[make(i, j) for i in range(I)]] = machine_usage[k]
+            A_ub.append(row)
+            b_ub.append(hours * (n_machines[k] - maintenance[j, k]))
+    for i in range(I):
+        for j in range(J):
+            row = np.zeros(n)
+            row[[make(i, j), sell(i, j), hold(i, j)]] = [1, -1, -1]
+            if j > 0:
+                row[hold(i, j-1)] = 1
+            A_eq.append(row)
+            b_eq.append(0)
+        row = np.zeros(n)
+        row[hold(i, J-1)] = 1
+        A_eq.append(row)
+        b_eq.append(holding_target)
+
+    bounds = [(0, None)] * n
+    for i in range(I):
+        for j in range(J):
+            bounds[hold(i, j)] = (0, holding_limit)
+            bounds[sell(i, j)] = (0, market_limits[j, i])
+    names = [f"{v}_{{{i+1}{j+1}}}" for v in "mhs" for i in range(I) for j in range(J)]
+    return LP(c, np.array(A_ub), np.array(b_ub, dtype=float), np.array(A_eq), np.array(b_eq, dtype=float), bounds, names)
+
+
+def distribution():
+    """
+    The distribution problem of the LP examples (part 1, lecture 6): shipping
+    from two factories through four depots to six customers at least cost,
+    as a maximisation of minus the cost.
+
+    The variables are the amounts x_ij from factory i to depot j, y_ik from
+    factory i to customer k and z_jk from depot j to customer k, in that
+    order. Impossible routes are fixed to zero by their bounds.
+    """
+    # Zero marks an impossible route
+    fac2dep = np.array([
+        [0.5, 0.5, 1.0, 0.2],
+        [0.0, 0.3, 0.5, 0.2],
+    ])
+    fac2c = np.array([
+        [1.0, 0.0, 1.5, 2.0, 0.0, 1.0],
+        [2.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    ])
+    dep2c = np.array([
+        [0.0, 1.5, 0.5, 1.5, 0.0, 1.0],
+        [1.0, 0.5, 0.5, 1.0, 0.5, 0.0],
+        [0.0, 1.5, 2.0, 0.0, 0.5, 1.5],
+        [0.0, 0.0, 0.2, 1.5, 0.5, 1.5],
+    ])
+    fac_capacity = np.array([150000, 200000], dtype=float)
+    dep_throughput = np.array([70000, 50000, 100000, 40000], dtype=float)
+    demands = np.array([50000, 10000, 40000, 35000, 60000, 20000], dtype=float)
+    I, J, K = 2, 4, 6
+    n = I*J + I*K + J*K
+    x = lambda i, j: i*J + j
+    y = lambda i, k: I*J + i*K + k
+    z = lambda j, k: I*J + I*K + j*K + k
+    costs = np.concatenate([fac2dep.ravel(), fac2c.ravel(), dep2c.ravel()])
+
+    A_ub, b_ub, A_eq, b_eq = [], [], [], []
+    for i in range(I):
+        row = np.zeros(n)
+        row[[x(i, j) for j in range(J)] + [y(i, k) for k in range(K)]] = 1
+        A_ub.append(row)
+        b_ub.append(fac_capacity[i])
+    for j in range(J):
+        row = np.zeros(n)
+        row[[x(i, j) for i in range(I)]] = 1
+        A_ub.append(row)
+        b_ub.append(dep_throughput[j])
+    for j in range(J):
+        row = np.zeros(n)
+        row[[z(j, k) for k in range(K)]] = 1
+        row[[x(i, j) for i in range(I)]] = -1
+        A_eq.append(row)
+        b_eq.append(0)
+    for k in range(K):
+        row = np.zeros(n)
+        row[[y(i, k) for i in range(I)] + [z(j, k) for j in range(J)]] = 1
+        A_eq.append(row)
+        b_eq.append(demands[k])
+
+    bounds = [(0, 0) if cost == 0 else (0, None) for cost in costs]
+    names = (
+        [f"x_{{{i+1}{j+1}}}" for i in range(I) for j in range(J)]
+        + [f"y_{{{i+1}{k+1}}}" for i in range(I) for k in range(K)]
+        + [f"z_{{{j+1}{k+1}}}" for j in range(J) for k in range(K)]
+    )
+    return LP(-costs, np.array(A_ub), np.array(b_ub), np.array(A_eq), np.array(b_eq, dtype=float), bounds, names)
+
+
+INSTANCES = {
+    "giapetto": giapetto,
+    "food_manufacture": food_manufacture,
+    "factory_planning": factory_planning,
+    "distribution": distribution,
+}
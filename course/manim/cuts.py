@@ -0,0 +1,217 @@
+"""
+Gomory mixed-integer cuts for the integer programs of branch_bound.py, and
+cut-and-branch: rounds of cuts at the root before branching.
+
+The cuts are read off rows of the optimal simplex tableau of the LP
+relaxation, as solved by dual_simplex. The Gomory mixed-integer cut of a row
+is the mixed-integer rounding (MIR) inequality of that row, after the
+nonbasic variables have been shifted to their bounds. A CutPool keeps the
+cuts found, skips duplicates and drops cuts that have been inactive for a
+while, so that the relaxation does not keep growing.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from branch_bound import branch_and_bound
+from dual_simplex import Basis, dual_simplex, tableau_row
+
+CutStats = namedtuple("CutStats", ["rounds", "cuts", "root_bound"])
+CutStats.__doc__ = """
+The effect of the cut rounds at the root: how many rounds were run, how
+many cuts were in the relaxation when branching started and the objective
+value of that relaxation.
+"""
+
+
+def slack_integrality(A, b, integer):
+    """
+    Returns which slacks b - A x are integer at every integer solution: those
+    of rows with integer coefficients on integer variables only, and an
+    integer right-hand side.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    whole = lambda a: np.abs(a - np.round(a)) < 1e-9
+    return np.all(whole(A) & (np.asarray(integer) | (A == 0)), axis=1) & whole(b)
+
+
+def gomory_cuts(A, b, lower, upper, integer, res, *, min_fraction=0.01, max_dynamism=1e6):
+    """
+    Returns the Gomory mixed-integer cuts of the rows of the optimal tableau
+    whose basic variable is integer but has a fractional value, as a list of
+    (a, beta) with a x <= beta.
+
+    res is the optimal Result of dual_simplex on these constraints. Rows
+    whose fractional part is within min_fraction of an integer, and cuts
+    whose largest and smallest coefficients differ by more than max_dynamism,
+    are skipped for numerical safety.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, n = A.shape
+    lo = np.concatenate([lower, np.zeros(m)])
+    hi = np.concatenate([upper, np.full(m, np.inf)])
+    is_integer = np.concatenate([integer, slack_integrality(A, b, integer)])
+    x = np.concatenate([res.x, b - A @ res.x])
+
+    basic, at_upper = res.basis
+    nonbasic = np.ones(n + m, dtype=bool)
+    nonbasic[basic] = False
+    # The shifted nonbasic variables y = x - lower or upper - x are zero now, and integer if x and its bound are
+    sign = np.where(at_upper, -1.0, 1.0)
+    bound = np.where(at_upper, hi, lo)
+    y_integer = is_integer & (np.abs(bound - np.round(bound)) < 1e-9)
+
+    cuts = []
+    for r, i in enumerate(basic):
+        f0 = x[i] - np.floor(x[i])
+        if not is_integer[i] or min(f0, 1-f0) < min_fraction:
+            continue
+        # Row r reads x_i + sum_j a_j y_j = x[i] over the nonbasic j
+        a = sign * tableau_row(A, Basis(basic, at_upper), r)
+        a[~nonbasic] = 0
+        f = a - np.floor(a)
+        # MIR of the row: sum_j g_j y_j >= 1
+        g = np.where(
+            y_integer,
+            np.where(f <= f0, f / f0, (1-f) / (1-f0)),
+            np.where(a > 0, a / f0, -a / (1-f0))
+        )
+        g[~nonbasic | (np.abs(g) < 1e-12)] = 0
+
+        # Back to x and the slacks, y = sign*(x - bound), then the slacks s = b - A x
+        coef = g * sign
+        rhs = 1 + coef @ np.where(nonbasic, bound, 0)
+        cut = coef[:n] - coef[n:] @ A
+        rhs -= coef[n:] @ b
+        nonzero = np.abs(cut[cut != 0])
+        if len(nonzero) == 0 or nonzero.max() / nonzero.min() > max_dynamism:
+            continue
+        # cut x >= rhs, with a little slack against rounding errors
+        cuts.append((-cut, -rhs + 1e-9 * (1 + abs(rhs))))
+    return cuts
+
+
+class CutPool:
+    """
+    The cuts added to a relaxation so far, with their ages.
+
+    Cuts are stored normalised so that their largest coefficient is 1 in
+    absolute value, which makes multiples of a cut duplicates. The age of a
+    cut is the number of consecutive rounds in which it was not tight at the
+    optimum of the relaxation; cuts older than max_age are dropped.
+    """
+
+    def __init__(self, n, max_age=3, tol=1e-6):
+        self.A = np.zeros((0, n))
+        self.b = np.zeros(0)
+        self.age = np.zeros(0, dtype=int)
+        self.max_age = max_age
+        self.tol = tol
+
+    def __len__(self):
+        return len(self.b)
+
+    def add(self, a, beta):
+        """
+        Adds a cut unless it is already in the pool, returning whether it was added.
+        """
+        scale = np.abs(a).max()
+        a = a / scale
+        beta = beta / scale
+        if len(self) and np.any(np.all(np.abs(self.A - a) < 1e-9, axis=1) & (np.abs(self.b - beta) < 1e-9)):
+            return False
+        self.A = np.vstack([self.A, a])
+        self.b = np.append(self.b, beta)
+        self.age = np.append(self.age, 0)
+        return True
+
+    def age_out(self, x):
+        """
+        Ages the cuts that are not tight at x and drops those older than
+        max_age. Returns a mask of the cuts that were kept.
+        """
+        tight = self.b - self.A @ x <= self.tol * (1 + np.abs(self.b))
+        self.age = np.where(tight, 0, self.age + 1)
+        keep = self.age <= self.max_age
+        self.A = self.A[keep]
+        self.b = self.b[keep]
+        self.age = self.age[keep]
+        return keep
+
+
+def _drop_rows(basis, n, m, keep):
+    """
+    Removes the rows of the cuts that are not kept from a basis in which their slacks are basic.
+    """
+    kept_slacks = n + np.flatnonzero(keep)
+    index = np.full(n + m, -1)
+    index[:n] = np.arange(n)
+    index[kept_slacks] = n + np.arange(len(kept_slacks))
+    basic = index[basis.basic]
+    at_upper = basis.at_upper[np.concatenate([np.arange(n), kept_slacks])]
+    return Basis(basic[basic >= 0], at_upper)
+
+
+def root_cuts(c, A, b, integer, bounds=None, *, rounds=10, max_age=3, min_improvement=1e-4):
+    """
+    Runs rounds of Gomory mixed-integer cuts on the LP relaxation, each
+    adding the new cuts of the current optimal tableau to a CutPool and
+    re-solving from the previous basis with the dual simplex method.
+
+    Stops after the given number of rounds, when no new cuts are found, when
+    the relaxation becomes integer or infeasible, or when the objective
+    improves by less than min_improvement. Returns the pool and the CutStats.
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    integer = np.asarray(integer, dtype=bool)
+    m, n = A.shape
+    if bounds is None:
+        bounds = [(0, None)] * n
+    lower = np.array([-np.inf if l is None else l for l, _ in bounds], dtype=float)
+    upper = np.array([np.inf if u is None else u for _, u in bounds], dtype=float)
+
+    pool = CutPool(n, max_age)
+    res = dual_simplex(c, A, b, lower, upper)
+    done = 0
+    for done in range(1, rounds + 1):
+        if res.status != "optimal":
+            break
+        A_all = np.vstack([A, pool.A])
+        b_all = np.concatenate([b, pool.b])
+        added = 0
+        for a, beta in gomory_cuts(A_all, b_all, lower, upper, integer, res):
+            added += pool.add(a, beta)
+        if added == 0:
+            break
+        # The slacks of the new rows join the basis, which keeps it dual feasible
+        n_rows = len(b_all)
+        basis = Basis(
+            np.concatenate([res.basis.basic, n + n_rows + np.arange(added)]),
+            np.concatenate([res.basis.at_upper, np.zeros(added, dtype=bool)])
+        )
+        new = dual_simplex(c, np.vstack([A, pool.A]), np.concatenate([b, pool.b]), lower, upper, basis)
+        if new.status != "optimal":
+            res = new
+            break
+        keep = pool.age_out(new.x)
+        basis = _drop_rows(new.basis, n, m + len(keep), np.concatenate([np.ones(m, dtype=bool), keep]))
+        improvement = res.obj - new.obj
+        res = new._replace(basis=basis)
+        if improvement < min_improvement:
+            break
+    return pool, CutStats(done, len(pool), res.obj)
+
+
+def cut_and_branch(c, A, b, integer, bounds=None, *, rounds=10, max_age=3, **kwargs):
+    """
+    Strengthens the relaxation with root_cuts and then solves the problem
+    with branch_and_bound on the constraints with the cuts added. Returns the
+    log and Stats of branch_and_bound, and the CutStats.
+    """
+    pool, cut_stats = root_cuts(c, A, b, integer, bounds, rounds=rounds, max_age=max_age)
+    log, stats = branch_and_bound(c, np.vstack([A, pool.A]), np.concatenate([b, pool.b]), integer, bounds, **kwargs)
+    return log, stats, cut_stats
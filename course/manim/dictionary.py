@@ -0,0 +1,247 @@
+"""
+The simplex method on dictionaries, in exact arithmetic, for generating the
+algebra that the SimplexGiapetto scene animates.
+
+For a problem
+
+    max c^T x  s.t.  A x <= b,  x >= 0
+
+with b >= 0, the first dictionary writes every slack s_i = b_i - A_i x and
+the objective as affine expressions of x. A pivot solves the row of the
+leaving variable for the entering one and substitutes the result into the
+objective and the other rows. All coefficients are Fractions, so the
+dictionaries are exactly those one would write by hand, and the entering
+variable is picked by one of ENTERING.
+"""
+from collections import namedtuple
+from fractions import Fraction
+
+Expression = namedtuple("Expression", ["constant", "terms"])
+Expression.__doc__ = """
+An affine expression: a Fraction plus a dict from variable index to nonzero Fraction coefficient.
+"""
+
+Pivot = namedtuple("Pivot", ["entering", "leaving", "solved", "substituted", "before", "after"])
+Pivot.__doc__ = """
+One pivot: the entering and leaving variables, the row of the leaving
+variable solved for the entering one, the basic variables into whose rows
+it was substituted besides the objective, and the dictionaries before and
+after.
+"""
+
+
+def substitute(expr, var, replacement):
+    """
+    Returns expr with the variable var replaced by the expression replacement.
+    """
+    coef = expr.terms.get(var)
+    if coef is None:
+        return expr
+    terms = {j: a for j, a in expr.terms.items() if j != var}
+    for j, a in replacement.terms.items():
+        terms[j] = terms.get(j, 0) + coef * a
+    return Expression(expr.constant + coef * replacement.constant, {j: a for j, a in terms.items() if a != 0})
+
+
+def solve_for(expr, basic, var):
+    """
+    Solves basic = expr for the variable var, which must appear in expr.
+    """
+    a = expr.terms[var]
+    terms = {j: -coef / a for j, coef in expr.terms.items() if j != var}
+    terms[basic] = 1 / a
+    return Expression(-expr.constant / a, terms)
+
+
+class Dictionary:
+    """
+    The basic variables and the objective as expressions of the nonbasic variables.
+
+    names are the TeX names of all variables, and rows maps the index of
+    every basic variable to its Expression.
+    """
+
+    def __init__(self, names, rows, objective):
+        self.names = names
+        self.rows = dict(sorted(rows.items()))
+        self.objective = objective
+
+    @property
+    def basic(self):
+        return list(self.rows)
+
+    @property
+    def nonbasic(self):
+        return [j for j in range(len(self.names)) if j not in self.rows]
+
+    def values(self):
+        """
+        Returns the values of all variables in the basic solution, with the nonbasic ones at zero.
+        """
+        return [self.rows[j].constant if j in self.rows else Fraction(0) for j in range(len(self.names))]
+
+    def ratio_test(self, entering):
+        """
+        Returns the basic variable that first reaches zero as entering grows,
+        the one with the lowest index on ties, or None if none does.
+        """
+        ratios = [
+            (row.constant / -row.terms[entering], i)
+            for i, row in self.rows.items() if row.terms.get(entering, 0) < 0
+        ]
+        return min(ratios)[1] if ratios else None
+
+    def pivot(self, entering, leaving):
+        """
+        Exchanges entering and leaving, returning the Pivot.
+        """
+        solved = solve_for(self.rows[leaving], leaving, entering)
+        rows = {entering: solved}
+        substituted = []
+        for i, row in self.rows.items():
+            if i == leaving:
+                continue
+            if entering in row.terms:
+                substituted.append(i)
+            rows[i] = substitute(row, entering, solved)
+        after = Dictionary(self.names, rows, substitute(self.objective, entering, solved))
+        return Pivot(entering, leaving, solved, substituted, self, after)
+
+
+def initial_dictionary(c, A, b, names=None):
+    """
+    Returns the dictionary with the slack variables basic. The variables are
+    named x_1, ..., x_n and s_1, ..., s_m unless names are given.
+    """
+    m, n = len(A), len(c)
+    if names is None:
+        names = [f"x_{{{j+1}}}" if j >= 9 else f"x_{j+1}" for j in range(n)]
+        names += [f"s_{{{i+1}}}" if i >= 9 else f"s_{i+1}" for i in range(m)]
+    rows = {
+        n + i: Expression(Fraction(b[i]), {j: -Fraction(A[i][j]) for j in range(n) if A[i][j] != 0})
+        for i in range(m)
+    }
+    objective = Expression(Fraction(0), {j: Fraction(c[j]) for j in range(n) if c[j] != 0})
+    return Dictionary(names, rows, objective)
+
+
+###
+# Entering rules: pick a nonbasic variable with a positive objective coefficient
+###
+
+def dantzig(dictionary, candidates):
+    """
+    The variable with the largest coefficient in the objective.
+    """
+    return max(candidates, key=lambda j: (dictionary.objective.terms[j], -j))
+
+def bland(dictionary, candidates):
+    """
+    The variable with the lowest index, which guarantees that the method terminates.
+    """
+    return min(candidates)
+
+def greatest_increase(dictionary, candidates):
+    """
+    The variable whose pivot increases the objective the most.
+    """
+    def increase(j):
+        leaving = dictionary.ratio_test(j)
+        if leaving is None:
+            return Fraction(10**18)  # Unbounded, pick it to find out
+        row = dictionary.rows[leaving]
+        return dictionary.objective.terms[j] * row.constant / -row.terms[j]
+    return max(candidates, key=lambda j: (increase(j), -j))
+
+def steepest_edge(dictionary, candidates):
+    """
+    The variable along whose edge the objective increases the most per unit
+    of distance, comparing the squared rates to stay in exact arithmetic.
+    """
+    def rate(j):
+        length = 1 + sum(row.terms.get(j, 0)**2 for row in dictionary.rows.values())
+        return dictionary.objective.terms[j]**2 / length
+    return max(candidates, key=lambda j: (rate(j), -j))
+
+ENTERING = {
+    "dantzig": dantzig,
+    "bland": bland,
+    "greatest_increase": greatest_increase,
+    "steepest_edge": steepest_edge,
+}
+
+
+def dictionary_simplex(c, A, b, entering="dantzig", *, names=None, max_pivots=1000):
+    """
+    Solves the problem with the dictionary simplex method, starting from the
+    slack basis, and returns the list of Pivots and the final Dictionary.
+
+    entering is a name from ENTERING or a function of the dictionary and the
+    list of candidate variables. Raises ValueError if b has negative entries,
+    since the slack basis is then infeasible, or if the problem is
+    unbounded, and RuntimeError if no optimal dictionary is reached in
+    max_pivots pivots.
+    """
+    if any(Fraction(bi) < 0 for bi in b):
+        raise ValueError("The slack basis is infeasible for negative b")
+    rule = ENTERING.get(entering, entering)
+    dictionary = initial_dictionary(c, A, b, names)
+    pivots = []
+    while True:
+        candidates = [j for j, a in dictionary.objective.terms.items() if a > 0]
+        if not candidates:
+            break
+        if len(pivots) == max_pivots:
+            raise RuntimeError(f"The dictionary simplex did not converge in {max_pivots} pivots")
+        j = rule(dictionary, sorted(candidates))
+        leaving = dictionary.ratio_test(j)
+        if leaving is None:
+            raise ValueError(f"The problem is unbounded along {dictionary.names[j]}")
+        pivots.append(dictionary.pivot(j, leaving))
+        dictionary = pivots[-1].after
+    return pivots, dictionary
+
+
+###
+# TeX
+###
+
+def fraction_tex(q):
+    """
+    TeX of the absolute value of a Fraction.
+    """
+    q = abs(q)
+    return str(q.numerator) if q.denominator == 1 else rf"\frac{{{q.numerator}}}{{{q.denominator}}}"
+
+
+def value_tex(q):
+    """
+    TeX of a Fraction.
+    """
+    return ("-" if q < 0 else "") + fraction_tex(q)
+
+
+def expression_parts(expr, names, *, substitute=None):
+    """
+    Returns the TeX of an expression as a list of (variable, tex) parts:
+    the constant, with variable None, unless it is zero, followed by the
+    terms by variable index. None of the parts is empty.
+
+    With substitute=(var, replacement), the term of var is written as its
+    coefficient followed by the replacement in parentheses, which becomes a
+    separate part with variable None, like 3(40-s_3) for 3x_1.
+    """
+    parts = []
+    if expr.constant != 0 or not expr.terms:
+        parts.append((None, value_tex(expr.constant)))
+    for j, a in sorted(expr.terms.items()):
+        sign = "-" if a < 0 else ("+" if parts else "")
+        coef = sign + ("" if abs(a) == 1 else fraction_tex(a))
+        if substitute is not None and j == substitute[0]:
+            if coef:
+                parts.append((j, coef))
+            inner = "".join(tex for _, tex in expression_parts(substitute[1], names))
+            parts.append((None, f"({inner})"))
+        else:
+            parts.append((j, coef + names[j]))
+    return parts
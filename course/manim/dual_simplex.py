@@ -0,0 +1,141 @@
+"""
+Bounded dual simplex method for LPs of the form
+
+    max c^T x  s.t.  A x <= b,  lower <= x <= upper
+
+that can be restarted from the optimal basis of a similar problem. After a
+bound change, as in a child node of branch and bound, that basis is still
+dual feasible, so a few dual pivots restore primal feasibility instead of
+solving from scratch.
+
+Internally a slack s = b - A x >= 0 is added per constraint and the
+problem is solved as min -c^T x over (x, s) with [A I] (x, s) = b.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+Basis = namedtuple("Basis", ["basic", "at_upper"])
+Basis.__doc__ = """
+A simplex basis: the indices of the m basic variables among the n
+structural and m slack variables, and which nonbasic variables sit at
+their upper bound rather than their lower one.
+"""
+
+Result = namedtuple("Result", ["status", "x", "obj", "basis", "pivots"])
+Result.__doc__ = """
+The outcome of dual_simplex. status is "optimal", "infeasible",
+"unbounded" or "cutoff", x and obj are the optimal solution and value (None
+unless optimal, obj is the bound that was reached on a cutoff), basis is the
+final Basis and pivots the number of pivots taken.
+"""
+
+BIG = 1e7  # Artificial bound for nonbasic variables that lack the finite bound dual feasibility needs
+
+
+def slack_basis(c, m):
+    """
+    Returns the dual feasible starting basis of the slack variables, with
+    every structural variable with a positive cost at its upper bound.
+    """
+    n = len(c)
+    at_upper = np.zeros(n + m, dtype=bool)
+    at_upper[:n] = np.asarray(c) > 0
+    return Basis(np.arange(n, n + m), at_upper)
+
+
+def dual_simplex(c, A, b, lower, upper, basis=None, *, cutoff=None, tol=1e-9, max_pivots=10000):
+    """
+    Solves the LP starting from basis, by default slack_basis, which has to be dual feasible.
+
+    Variables that have to sit at an infinite bound for the start to be dual
+    feasible are given the artificial bound BIG instead. If one of them is
+    still there at the end, the LP is reported as unbounded.
+
+    The objective value of every dual feasible basis bounds the optimum from
+    above and decreases with each pivot. Once it is no more than cutoff, the
+    solve stops with status "cutoff", which saves the remaining pivots on
+    nodes of branch and bound that cannot beat the incumbent.
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, n = A.shape
+    M = np.hstack([A, np.eye(m)])
+    cost = np.concatenate([-c, np.zeros(m)])
+    lo = np.concatenate([lower, np.zeros(m)])
+    hi = np.concatenate([upper, np.full(m, np.inf)])
+
+    if basis is None:
+        basis = slack_basis(c, m)
+    basic = basis.basic.copy()
+    at_upper = basis.at_upper.copy()
+
+    nonbasic = np.ones(n + m, dtype=bool)
+    nonbasic[basic] = False
+    artificial_hi = nonbasic & at_upper & np.isinf(hi)
+    artificial_lo = nonbasic & ~at_upper & np.isinf(lo)
+    hi = np.where(artificial_hi, BIG, hi)
+    lo = np.where(artificial_lo, -BIG, lo)
+
+    if artificial_hi.any() or artificial_lo.any():
+        cutoff = None  # The bounds only hold for the problem with artificial bounds
+    B_inv = np.linalg.inv(M[:, basic])
+    for pivots in range(max_pivots + 1):
+        if pivots % 50 == 0:
+            B_inv = np.linalg.inv(M[:, basic])  # Refactor to keep rounding errors in check
+
+        x = np.where(at_upper, hi, lo)
+        x[basic] = 0
+        x[basic] = B_inv @ (b - M @ x)
+
+        # Leaving variable: the basic variable furthest outside its bounds
+        infeasibility = np.maximum(lo[basic] - x[basic], x[basic] - hi[basic])
+        r = np.argmax(infeasibility)
+        if infeasibility[r] <= tol * (1 + np.abs(x[basic[r]])):
+            break
+        if cutoff is not None and c @ x[:n] <= cutoff:
+            return Result("cutoff", None, c @ x[:n], Basis(basic, at_upper), pivots)
+        to_lower = x[basic[r]] < lo[basic[r]]
+
+        # Entering variable: ratio test on the reduced costs along row r of the tableau
+        d = cost - (cost[basic] @ B_inv) @ M
+        alpha_r = B_inv[r] @ M
+        nonbasic = np.ones(n + m, dtype=bool)
+        nonbasic[basic] = False
+        if to_lower:
+            eligible = nonbasic & np.where(at_upper, alpha_r > tol, alpha_r < -tol)
+        else:
+            eligible = nonbasic & np.where(at_upper, alpha_r < -tol, alpha_r > tol)
+        if not eligible.any():
+            return Result("infeasible", None, None, Basis(basic, at_upper), pivots)
+        ratios = np.full(n + m, np.inf)
+        ratios[eligible] = np.abs(d[eligible]) / np.abs(alpha_r[eligible])
+        # Among (nearly) tied ratios prefer the largest pivot for stability
+        ties = ratios <= ratios.min() + tol
+        q = np.flatnonzero(ties)[np.argmax(np.abs(alpha_r[ties]))]
+
+        leaving = basic[r]
+        alpha_q = B_inv @ M[:, q]
+        B_inv[r] /= alpha_q[r]
+        others = np.arange(m) != r
+        B_inv[others] -= np.outer(alpha_q[others], B_inv[r])
+        basic[r] = q
+        at_upper[q] = False
+        at_upper[leaving] = not to_lower
+    else:
+        raise RuntimeError(f"Dual simplex did not converge in {max_pivots} pivots")
+
+    if np.any((artificial_hi | artificial_lo) & np.isclose(np.abs(x), BIG)):
+        return Result("unbounded", None, None, Basis(basic, at_upper), pivots)
+    return Result("optimal", x[:n], c @ x[:n], Basis(basic, at_upper), pivots)
+
+
+def tableau_row(A, basis, r):
+    """
+    Returns row r of the simplex tableau B^-1 [A I] for the given basis.
+    """
+    A = np.asarray(A, dtype=float)
+    m = A.shape[0]
+    M = np.hstack([A, np.eye(m)])
+    return np.linalg.solve(M[:, basis.basic].T, np.eye(m)[r]) @ M
@@ -0,0 +1,261 @@
+"""
+Primal-dual interior point method for problems of the form
+
+    min f(x)  s.t.  g(x) = 0,  x >= 0
+
+as presented in the IPM scene. The derivatives of f and g are passed either
+as callables of x or, when they are constant, as arrays.
+"""
+from collections import namedtuple
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+import scipy.sparse.linalg
+
+
+def _as_function(a):
+    """
+    Wraps a constant array into a function of x, leaves callables as they are.
+    """
+    if callable(a):
+        return a
+    if not sp.issparse(a):
+        a = np.asarray(a, dtype=float)
+    return lambda x: a
+
+
+class NewtonSystem:
+    """
+    The Newton system of the barrier problem, reduced to its condensed form.
+
+    The last block row of the full system, Z dx + X du = rho e - XZe, gives
+    du = rho/x - u - (u/x) dx. Substituting it into the first block row
+    leaves the symmetric system
+
+        [H + U/X   J^T] [ dx]   [rho/x + J^T v - grad]
+        [J         0  ] [-dv] = [-g                  ]
+
+    of size n+m instead of 2n+m. Its matrix and right-hand side live in
+    buffers allocated once and overwritten on every solve.
+    """
+
+    def __init__(self, n, m):
+        self.n = n
+        self.m = m
+        self.matrix = np.zeros((n+m, n+m))
+        self.rhs = np.zeros(n+m)
+
+    def solve(self, x, v, u, rho, grad, hess, g, jac):
+        """
+        Returns the Newton direction (dx, dv, du) at (x, v, u).
+        """
+        n = self.n
+        hess = np.asarray(hess, dtype=float)
+        jac = np.atleast_2d(np.asarray(jac, dtype=float))
+        K = self.matrix
+        K[:n, :n] = hess
+        K[:n, n:] = jac.T
+        K[n:, :n] = jac
+        K[n:, n:] = 0
+        K[range(n), range(n)] += u / x
+
+        r = self.rhs
+        r[:n] = rho / x + jac.T @ v - grad
+        r[n:] = -g
+
+        d = scipy.linalg.solve(K, r, assume_a="sym", overwrite_a=True, overwrite_b=True, check_finite=False)
+        dx = d[:n]
+        dv = -d[n:]
+        du = rho / x - u - u / x * dx
+        return dx, dv, du
+
+
+def _coo(a, shape):
+    """
+    Returns a as a COO matrix of the given shape. Dense arrays keep all
+    their entries, zeros included, so that their pattern is the whole block
+    whatever their values.
+    """
+    if sp.issparse(a):
+        return sp.coo_matrix(a)
+    a = np.asarray(a, dtype=float).reshape(shape)
+    rows, cols = np.indices(shape)
+    return sp.coo_matrix((a.ravel(), (rows.ravel(), cols.ravel())), shape=shape)
+
+
+class SparseNewtonSystem:
+    """
+    The condensed Newton system of NewtonSystem, assembled and factorized as
+    a sparse matrix.
+
+    The sparsity pattern of the matrix only depends on those of the Hessian
+    and the Jacobian, so its compressed-column structure and the slot of
+    every entry in it are computed on the first solve. Later solves only
+    scatter the new values into the data array. The first solve also lets
+    splu find a fill-reducing column ordering with COLAMD, and later solves
+    factorize the matrix with its columns in that order and
+    permc_spec="NATURAL", so the ordering is computed only once. Sparse
+    Hessians and Jacobians must stay within the sparsity pattern they had on
+    the first solve, while dense ones are taken as entirely nonzero. A
+    singular matrix raises LinAlgError, as in NewtonSystem.
+    """
+
+    def __init__(self, n, m):
+        self.n = n
+        self.m = m
+        self.keys = None
+        self.columns = None
+
+    def _structure(self, rows, cols):
+        N = self.n + self.m
+        # Entries sorted by column and then row are in compressed-column order
+        self.keys = np.unique(cols*N + rows)
+        self.indices = self.keys % N
+        self.indptr = np.searchsorted(self.keys // N, np.arange(N+1))
+
+    def solve(self, x, v, u, rho, grad, hess, g, jac):
+        """
+        Returns the Newton direction (dx, dv, du) at (x, v, u).
+        """
+        n = self.n
+        N = n + self.m
+        H = _coo(hess, (n, n))
+        J = _coo(jac, (self.m, n))
+        diag = np.arange(n)
+        rows = np.concatenate([H.row, diag, J.col, n + J.row])
+        cols = np.concatenate([H.col, diag, n + J.row, J.col])
+        vals = np.concatenate([H.data, u / x, J.data, J.data])
+
+        if self.keys is None:
+            self._structure(rows, cols)
+        keys = cols*N + rows
+        slots = np.searchsorted(self.keys, keys)
+        if np.any(slots >= len(self.keys)) or np.any(self.keys[np.minimum(slots, len(self.keys)-1)] != keys):
+            raise ValueError("The Hessian or the Jacobian left the sparsity pattern of the first iteration")
+        data = np.bincount(slots, weights=vals, minlength=len(self.keys))
+        K = sp.csc_matrix((data, self.indices, self.indptr), shape=(N, N))
+
+        r = np.concatenate([rho / x + J.T @ v - grad, -np.asarray(g, dtype=float)])
+        try:
+            if self.columns is None:
+                lu = scipy.sparse.linalg.splu(K)
+                # Column perm_c[j] of K is column j of the factorized matrix
+                self.columns = np.argsort(lu.perm_c)
+                d = lu.solve(r)
+            else:
+                d = np.empty(N)
+                d[self.columns] = scipy.sparse.linalg.splu(K[:, self.columns], permc_spec="NATURAL").solve(r)
+        except RuntimeError as e:
+            # splu reports a singular matrix with RuntimeError, the dense solve with LinAlgError
+            raise np.linalg.LinAlgError(str(e)) from None
+        dx = d[:n]
+        dv = -d[n:]
+        du = rho / x - u - u / x * dx
+        return dx, dv, du
+
+
+def step_size(x, d, eps, decimals=None):
+    """
+    Returns the step along d that goes a fraction 1-eps of the way to the
+    boundary of x > 0, capped at 1-eps.
+
+    x and d may hold a batch of points and directions along their leading
+    axes, in which case one step per point is returned. The step is only
+    rounded when decimals is given.
+    """
+    x = np.asarray(x, dtype=float)
+    d = np.asarray(d, dtype=float)
+    with np.errstate(divide="ignore"):
+        ratios = np.where(d < 0, -x / d, np.inf)
+    a = (1-eps) * np.minimum(1, ratios.min(axis=-1))
+    if decimals is not None:
+        a = np.round(a, decimals=decimals)
+    return a
+
+
+Iterate = namedtuple("Iterate", [
+    "x", "v", "u", "rho",
+    "primal_residual", "dual_residual", "complementarity",
+    "alpha_p", "alpha_d"
+])
+Iterate.__doc__ = """
+One iterate of the method: the point (x, v, u), the barrier parameter rho
+used to compute the next direction, the residuals at the point and the
+primal and dual step sizes that led to it (nan for the initial point).
+"""
+
+Trajectory = namedtuple("Trajectory", Iterate._fields + ("converged",))
+Trajectory.__doc__ = """
+All iterates of a run, with every field of Iterate stacked into an array
+with one row per iterate, and whether the run met the tolerances.
+"""
+
+
+def primal_dual_iterates(grad, hess, g, jac, x0, *, v0=None, u0=None, rho=10.0, beta=0.5, eps=1e-3, tol=1e-6, max_iter=100, decimals=None, sparse=None):
+    """
+    Runs the primal-dual interior point method from x0, yielding every iterate.
+
+    grad and hess are the gradient and Hessian of the objective, g the
+    equality constraints and jac their Jacobian. The multipliers v of the
+    equality constraints start at v0 (zero by default) and those of the
+    bounds at u0 (rho/x0 by default). The barrier parameter rho is multiplied
+    by beta after every iteration, and steps stop short of the boundary by a
+    factor 1-eps. The primal and dual step sizes are rounded to the given
+    number of decimals, if any.
+
+    The method stops at the first iterate where the primal residual |g(x)|,
+    the dual residual |grad - J^T v - u| (both in the max norm) and the
+    average complementarity x.u/n are all below tol, or after max_iter
+    iterations.
+
+    The Newton system is solved with SparseNewtonSystem if sparse is True,
+    or by default if the Hessian or the Jacobian at x0 is a SciPy sparse
+    matrix, and with the dense NewtonSystem otherwise.
+    """
+    grad, hess, g, jac = map(_as_function, (grad, hess, g, jac))
+    x = np.asarray(x0, dtype=float)
+    n = len(x)
+    m = len(np.atleast_1d(g(x)))
+    if sparse is None:
+        sparse = sp.issparse(hess(x)) or sp.issparse(jac(x))
+    system = SparseNewtonSystem(n, m) if sparse else NewtonSystem(n, m)
+
+    v = np.zeros(m) if v0 is None else np.asarray(v0, dtype=float)
+    u = rho / x if u0 is None else np.asarray(u0, dtype=float)
+    alpha_p = alpha_d = np.nan
+
+    for i in range(max_iter+1):
+        grad_x = np.asarray(grad(x), dtype=float)
+        g_x = np.atleast_1d(g(x))
+        jac_x = jac(x)
+        if not sp.issparse(jac_x):
+            # A single constraint may give its gradient as a 1-D array
+            jac_x = np.atleast_2d(np.asarray(jac_x, dtype=float))
+        if jac_x.shape != (m, n):
+            raise ValueError(f"The Jacobian has shape {jac_x.shape}, expected {(m, n)}")
+
+        primal = np.abs(g_x).max(initial=0)
+        dual = np.abs(grad_x - jac_x.T @ v - u).max(initial=0)
+        complementarity = x @ u / n
+        yield Iterate(x, v, u, rho, primal, dual, complementarity, alpha_p, alpha_d)
+        if max(primal, dual, complementarity) < tol or i == max_iter:
+            return
+
+        dx, dv, du = system.solve(x, v, u, rho, grad_x, hess(x), g_x, jac_x)
+        alpha_p, alpha_d = step_size([x, u], [dx, du], eps, decimals)
+
+        x = x + alpha_p*dx
+        v = v + alpha_d*dv
+        u = u + alpha_d*du
+        rho *= beta
+
+
+def primal_dual_ip(grad, hess, g, jac, x0, *, tol=1e-6, **kwargs):
+    """
+    Runs primal_dual_iterates to the end and returns the recorded Trajectory.
+    """
+    iterates = list(primal_dual_iterates(grad, hess, g, jac, x0, tol=tol, **kwargs))
+    last = iterates[-1]
+    converged = max(last.primal_residual, last.dual_residual, last.complementarity) < tol
+    return Trajectory(*map(np.array, zip(*iterates)), converged)
@@ -0,0 +1,96 @@
+"""
+Sweeps the parameters of the interior point method on the problem of the IPM scene.
+
+    python ipm_sweep.py --rho 1 5 10 --beta 0.2 0.5 0.8 --x0 0.5,1,0.75 1,1,1
+
+runs primal_dual_ip for every combination of rho, beta and starting point on
+a process pool and prints the iteration counts and final residuals, fastest
+converging runs first. --csv also writes the table to a file.
+"""
+import argparse
+import csv
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import barrier_problem
+from ipm import primal_dual_ip
+
+COLUMNS = ["rho", "beta", "x0", "iterations", "converged", "primal_residual", "dual_residual", "complementarity"]
+
+
+def run(args):
+    """
+    Solves the problem for one combination of parameters and summarises the trajectory.
+    """
+    problem, rho, beta, x0, kwargs = args
+    row = {"rho": rho, "beta": beta, "x0": tuple(float(a) for a in x0)}
+    try:
+        t = primal_dual_ip(*problem, x0, rho=rho, beta=beta, **kwargs)
+    except np.linalg.LinAlgError:
+        # A singular Newton system ends the run, which counts as a failure
+        return {**row, "iterations": None, "converged": False,
+                "primal_residual": np.nan, "dual_residual": np.nan, "complementarity": np.nan}
+    return {
+        **row,
+        "iterations": len(t.x) - 1,
+        "converged": bool(t.converged),
+        "primal_residual": float(t.primal_residual[-1]),
+        "dual_residual": float(t.dual_residual[-1]),
+        "complementarity": float(t.complementarity[-1]),
+    }
+
+
+def sweep(problem, rhos, betas, x0s, *, processes=None, **kwargs):
+    """
+    Runs primal_dual_ip for every combination of rho, beta and x0 in parallel.
+
+    problem is the tuple (grad, hess, g, jac) passed on to primal_dual_ip,
+    made of module-level functions so that it can be sent to the worker
+    processes, and kwargs are further options of primal_dual_ip. Returns one
+    row per run as returned by run, in the order of the combinations.
+    """
+    tasks = [
+        (problem, rho, beta, np.asarray(x0, dtype=float), kwargs)
+        for rho, beta, x0 in itertools.product(rhos, betas, x0s)
+    ]
+    with ProcessPoolExecutor(processes) as pool:
+        return list(pool.map(run, tasks, chunksize=max(1, len(tasks) // 64)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rho", type=float, nargs="+", default=[1, 2, 5, 10, 20, 50])
+    parser.add_argument("--beta", type=float, nargs="+", default=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
+    parser.add_argument("--x0", type=lambda s: [float(a) for a in s.split(",")], nargs="+", default=[barrier_problem.x0])
+    parser.add_argument("--tol", type=float, default=1e-6)
+    parser.add_argument("--max-iter", type=int, default=100)
+    parser.add_argument("--decimals", type=int, default=None, help="round step sizes like the scene does (3)")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--csv", help="also write the table to this file")
+    args = parser.parse_args()
+
+    rows = sweep(
+        (barrier_problem.grad_f, barrier_problem.hess_f, barrier_problem.g, barrier_problem.jac_g),
+        args.rho, args.beta, args.x0,
+        processes=args.processes,
+        tol=args.tol, max_iter=args.max_iter, decimals=args.decimals
+    )
+    rows.sort(key=lambda r: (not r["converged"], r["iterations"] is None, r["iterations"] or 0))
+
+    print(f"{'rho':>8} {'beta':>6} {'x0':>24} {'iter':>5} {'conv':>5} {'primal':>10} {'dual':>10} {'compl':>10}")
+    for r in rows:
+        x0 = ",".join(f"{a:g}" for a in r["x0"])
+        print(f"{r['rho']:>8g} {r['beta']:>6g} {x0:>24} {str(r['iterations']):>5} {str(r['converged']):>5} "
+              f"{r['primal_residual']:>10.2e} {r['dual_residual']:>10.2e} {r['complementarity']:>10.2e}")
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()
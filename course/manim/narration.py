@@ -0,0 +1,208 @@
+"""
+Narration at the bottom left corner of scenes, compiled in one LaTeX run.
+
+Every Tex compiles its own LaTeX document and converts it to SVG with
+dvisvgm, and a Tex of several strings compiles each of them separately as
+well, which dominates the first render of a scene with dozens of narration
+lines. A NarratedScene instead collects its lines up front: the literal
+arguments of create_text and replace_text in its source, and the lines it
+showed in its previous render, recorded in media/narration. Those not yet
+in the Tex cache of manim are typeset as the pages of a single document,
+converted by one dvisvgm call, and every page is stored where Tex looks for
+the SVG of its line, so the Tex of every line is then only parsed. Lines
+that are new since the last render compile on their own as before.
+"""
+import ast
+import inspect
+import json
+import os
+import re
+import subprocess
+import textwrap
+from pathlib import Path
+
+from manim import DL, Tex, Transform, Write, config, logger
+from manim.mobject.text.tex_mobject import SingleStringMathTex
+from manim.utils.tex_file_writing import compile_tex, generate_tex_file, tex_hash
+
+TEXT_FONT_SIZE = 32
+
+
+def tex_strings(line):
+    """
+    Returns the strings that the Tex of a narration line compiles: the whole
+    line and, for a tuple of strings, each of them, as modified by
+    SingleStringMathTex before typesetting.
+
+    The modification is a private method of manim, so if it is missing no
+    strings are returned and every line compiles on its own.
+    """
+    parts = [p for p in (line if isinstance(line, tuple) else (line,)) if p]
+    # Only the modification of the string is needed, not a whole SingleStringMathTex
+    try:
+        modify = SingleStringMathTex.__new__(SingleStringMathTex)._get_modified_expression
+    except AttributeError:
+        return []
+    return list(dict.fromkeys(modify(s) for s in ["".join(parts), *parts]))
+
+
+def batch_compile(expressions, environment="center", tex_template=None):
+    """
+    Compiles the expressions whose SVGs are not in the Tex cache yet as the
+    pages of one document, and stores the SVG of every page where
+    tex_to_svg_file looks for it. Returns the number of SVGs stored.
+
+    Needs a template of the standalone class, whose multi mode makes every
+    standalone environment a page. Otherwise, or if the document does not
+    compile, dvisvgm fails or gives the wrong number of pages, nothing is
+    stored and every expression compiles on its own later.
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    missing = {}
+    for expr in dict.fromkeys(expressions):
+        svg = generate_tex_file(expr, environment, tex_template).with_suffix(".svg")
+        if not svg.exists():
+            missing[expr] = svg
+    documentclass = re.sub(r"^\\documentclass\[(.*)\]\{standalone\}$", r"\\documentclass[\1,multi]{standalone}",
+                           tex_template.documentclass)
+    if len(missing) < 2 or documentclass == tex_template.documentclass:
+        return 0
+
+    template = tex_template.copy()
+    template.documentclass = documentclass
+    pages = "\n".join(
+        "\n".join([r"\begin{standalone}", rf"\begin{{{environment}}}", expr, rf"\end{{{environment}}}", r"\end{standalone}"])
+        for expr in missing
+    )
+    document = template.get_texcode_for_expression(pages)
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    tex_file = tex_dir / f"narration_{tex_hash(document)}.tex"
+    tex_file.write_text(document, encoding="utf-8")
+    try:
+        dvi_file = compile_tex(tex_file, template.tex_compiler, template.output_format)
+    except ValueError:
+        logger.warning("Could not compile the narration in one run, compiling every line on its own")
+        return 0
+
+    stem = tex_file.stem
+    command = ["dvisvgm", "--page=1-", "--no-fonts", "--verbosity=0", f"--output={tex_dir / stem}-%p.svg", str(dvi_file)]
+    if template.output_format == ".pdf":
+        command.insert(1, "--pdf")
+    try:
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        logger.warning("Could not convert the narration to SVG in one run, compiling every line on its own")
+        for p in tex_dir.glob(f"{stem}-*.svg"):
+            p.unlink()
+        return 0
+    page_files = sorted(tex_dir.glob(f"{stem}-*.svg"), key=lambda p: int(p.stem.rsplit("-", 1)[1]))
+    if len(page_files) != len(missing):
+        for p in page_files:
+            p.unlink()
+        return 0
+    for page, svg in zip(page_files, missing.values()):
+        os.replace(page, svg)
+    return len(missing)
+
+
+def source_lines(scene_class):
+    """
+    Returns the narration lines written as literals in the source of a
+    scene, that is, the strings and tuples of strings passed to create_text
+    or replace_text. Formatted strings are left out.
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(scene_class)))
+    except (OSError, TypeError):
+        return []
+    position = {"create_text": 0, "replace_text": 1}
+    lines = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in position):
+            continue
+        if len(node.args) <= position[node.func.attr]:
+            continue
+        try:
+            line = ast.literal_eval(node.args[position[node.func.attr]])
+        except (ValueError, TypeError):
+            continue
+        if isinstance(line, str) or (isinstance(line, tuple) and all(isinstance(s, str) for s in line)):
+            lines.append(line)
+    return lines
+
+
+class Narration:
+    """
+    The narration lines of a scene as Tex mobjects at the bottom left corner.
+
+    Creating it compiles the lines of source_lines and of the record of the
+    previous render with batch_compile. Every line is turned into a Tex once,
+    and text returns copies of it.
+    """
+
+    def __init__(self, scene_class, *, font_size=TEXT_FONT_SIZE):
+        self.font_size = font_size
+        self.record = Path(config.media_dir) / "narration" / f"{scene_class.__name__}.json"
+        lines = source_lines(scene_class)
+        if self.record.exists():
+            lines += [tuple(line) if isinstance(line, list) else line for line in json.loads(self.record.read_text())]
+        batch_compile([s for line in dict.fromkeys(lines) for s in tex_strings(line)])
+        self.mobjects = {}
+        self.shown = {}
+
+    def text(self, line):
+        """
+        Returns the Tex of a line, a string or a tuple of strings that become separate parts.
+        """
+        if line not in self.mobjects:
+            parts = line if isinstance(line, tuple) else (line,)
+            self.mobjects[line] = Tex(*parts, font_size=self.font_size).to_corner(DL)
+        self.shown[line] = None
+        return self.mobjects[line].copy()
+
+    def save(self):
+        """
+        Records the lines shown so far for the next render.
+        """
+        self.record.parent.mkdir(parents=True, exist_ok=True)
+        self.record.write_text(json.dumps(list(self.shown), indent=1))
+
+
+class NarratedScene:
+    """
+    Mixin for scenes narrated at the bottom left corner, listed before the
+    scene class as in class BNB(NarratedScene, Scene).
+    """
+
+    def setup(self):
+        super().setup()
+        self.narration = Narration(type(self))
+
+    def tear_down(self):
+        self.narration.save()
+        super().tear_down()
+
+    def create_text(self, str):
+        """
+        Creates the text at the bottom left corner
+        """
+        text = self.narration.text(str)
+        self.play(Write(text))
+        return text
+
+    def replace_text(self, text_mobj, str, *, wait=1.5, t2c=None):
+        """
+        Transforms text_mobj to one with str, with some hardcoded settings
+
+        str may be a tuple of strings, which become separate parts of the
+        Tex, and t2c maps a part to its color.
+        """
+        tmp = self.narration.text(str)
+        if t2c:
+            for k, v in t2c.items():
+                tmp.set_color_by_tex(k, v)
+        self.play(Transform(text_mobj, tmp))
+        self.remove(tmp)
+        self.wait(wait)
@@ -0,0 +1,154 @@
+"""
+Helpers for drawing the feasible regions of linear constraints in two variables.
+"""
+import numpy as np
+from scipy.optimize import linprog
+
+from manim import BLUE, GREEN, Polygon, Transform
+
+TOL = 1e-9
+
+
+def half_planes(A, b, lower=(0, 0), upper=(np.inf, np.inf)):
+    """
+    Returns (G, h) such that G x <= h describes A x <= b and lower <= x <= upper, leaving out infinite bounds.
+    """
+    A = np.atleast_2d(np.asarray(A, dtype=float)).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).reshape(-1)
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    eye = np.eye(2)
+    G = np.vstack([A, -eye[np.isfinite(lower)], eye[np.isfinite(upper)]])
+    h = np.concatenate([b, -lower[np.isfinite(lower)], upper[np.isfinite(upper)]])
+    return G, h
+
+
+def polygon_vertices(A, b, lower=(0, 0), upper=(np.inf, np.inf)):
+    """
+    Returns the vertices of {x : A x <= b, lower <= x <= upper} in counterclockwise order.
+
+    Every vertex is the intersection of two of the boundary lines, so all
+    pairwise intersections are computed at once with Cramer's rule and the
+    ones satisfying every constraint are kept. The result is an (n, 2)
+    array, empty if the region is empty, starting from the vertex with the
+    smallest x_1 (and then x_2). Raises ValueError for nonempty unbounded
+    regions, which need finite upper bounds, such as the range of the axes,
+    to be drawn.
+    """
+    G, h = half_planes(A, b, lower, upper)
+    i, j = np.triu_indices(len(G), k=1)
+    det = G[i, 0]*G[j, 1] - G[i, 1]*G[j, 0]
+    ok = np.abs(det) > TOL
+    i, j, det = i[ok], j[ok], det[ok]
+    points = np.column_stack([
+        (h[i]*G[j, 1] - h[j]*G[i, 1]) / det,
+        (G[i, 0]*h[j] - G[j, 0]*h[i]) / det,
+    ])
+    feasible = np.all(points @ G.T <= h + TOL * (1 + np.abs(h)), axis=1)
+    points = points[feasible]
+    # A nonempty region without a vertex contains a line, so all boundary
+    # lines are parallel and only an LP tells whether it is empty
+    if len(points) == 0 and len(G) > 0:
+        if np.linalg.matrix_rank(G, tol=TOL) == 2 or linprog(np.zeros(2), A_ub=G, b_ub=h, bounds=(None, None)).status == 2:
+            return np.zeros((0, 2))
+
+    # The region is unbounded if its recession cone {d : G d <= 0} has a
+    # nonzero direction, and then one along the boundary of some half-plane
+    rays = np.vstack([G[:, ::-1] * [-1, 1], G[:, ::-1] * [1, -1]])
+    rays = rays[np.linalg.norm(rays, axis=1) > TOL]
+    if len(G) == 0 or np.any(np.all(rays @ G.T <= TOL * np.linalg.norm(rays, axis=1)[:, np.newaxis], axis=1)):
+        raise ValueError("The region is unbounded")
+
+    # Several lines through one vertex give it several times
+    points = np.unique(np.round(points, 9) + 0.0, axis=0)
+    center = points.mean(axis=0)
+    points = points[np.argsort(np.arctan2(*(points - center).T[::-1]))]
+    return np.roll(points, -np.lexsort(points.T[::-1])[0], axis=0)
+
+
+def clip(vertices, a, beta, *, aligned=False):
+    """
+    Clips a convex polygon, given by its vertices in counterclockwise order, to the half-plane a x <= beta.
+
+    Every edge whose endpoints lie on different sides of the boundary line
+    contributes the point where it crosses it, so one constraint costs
+    O(len(vertices)) instead of recomputing the region. The vertices
+    outside the half-plane form one run, which is replaced by the two
+    crossing points.
+
+    With aligned=True, returns (start, end) instead: two arrays of the same
+    length, start with the old polygon and end with the clipped one, where
+    the vertices of the run are moved to evenly spaced points on the new
+    edge. A run of a single vertex is doubled in start. Transforming a
+    polygon of start into one of end then slides the cut-off corner onto the
+    constraint.
+    """
+    v = np.asarray(vertices, dtype=float)
+    a = np.asarray(a, dtype=float)
+    s = v @ a - beta
+    inside = s <= TOL * (1 + abs(beta))
+    if inside.all():
+        return (v, v) if aligned else v
+    if not inside.any():
+        empty = np.zeros((0, 2))
+        return (v, np.repeat(v.mean(axis=0, keepdims=True), len(v), axis=0)) if aligned else empty
+
+    # Crossing of every edge (v[i], v[i+1]) that changes sides
+    nxt = np.roll(v, -1, axis=0)
+    s_nxt = np.roll(s, -1)
+    crossed = inside != np.roll(inside, -1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(crossed, s / (s - s_nxt), 0)
+    crossings = v + t[:, np.newaxis] * (nxt - v)
+
+    if not aligned:
+        candidates = np.stack([v, crossings], axis=1)
+        return candidates[np.column_stack([inside, crossed])]
+
+    # The run of outside vertices starts after the edge that leaves the half-plane
+    n = len(v)
+    first = np.flatnonzero(~inside & np.roll(inside, 1))[0]
+    length = np.argmax(np.roll(inside, -first))
+    run = (first + np.arange(length)) % n
+    p = crossings[(first - 1) % n]
+    q = crossings[run[-1]]
+    end = v.copy()
+    end[run] = p + np.linspace(0, 1, length)[:, np.newaxis] * (q - p) if length > 1 else p
+    start = v
+    if length == 1:
+        start = np.insert(v, first + 1, v[first], axis=0)
+        end = np.insert(end, first + 1, q, axis=0)
+    return start, end
+
+
+def clip_sequence(vertices, A, b):
+    """
+    Clips a polygon by the constraints A x <= b one at a time, and returns
+    the aligned (start, end) pair of clip for every step, for animating
+    their addition.
+    """
+    steps = []
+    for a, beta in zip(np.atleast_2d(A), np.atleast_1d(b)):
+        steps.append(clip(vertices, a, beta, aligned=True))
+        vertices = clip(vertices, a, beta)
+    return steps
+
+
+def polygon_mobject(ax, vertices, *, color=(BLUE, GREEN), opacity=0.5, **kwargs):
+    """
+    Creates a filled polygon with the given vertices, in the coordinates of
+    ax, styled like the areas of ax.get_area.
+    """
+    return Polygon(*ax.c2p(np.asarray(vertices)), **kwargs).set_opacity(opacity).set_color(color)
+
+
+def clip_area(scene, ax, area, step):
+    """
+    Plays the animation of one step of clip_sequence on area, a polygon_mobject in the coordinates of ax.
+
+    area first takes the shape of start, which is the polygon it already
+    shows, possibly with a doubled vertex, and is then transformed into end.
+    """
+    start, end = step
+    area.become(polygon_mobject(ax, start))
+    scene.play(Transform(area, polygon_mobject(ax, end)))
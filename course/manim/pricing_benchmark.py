@@ -0,0 +1,172 @@
+"""
+Compares the pricing rules of revised_simplex.py on the LPs of the course
+and on generated ones.
+
+    python pricing_benchmark.py --json results.json --baseline pricing_baseline.json
+
+solves every LP of the corpus with every pricing rule and prints the
+iterations of both phases, how many of them were degenerate, the wall time
+and the objective, fewest iterations first within each LP. --csv and --json
+also write the results to files.
+
+--baseline compares the results with those of an earlier --json run: a
+different status or objective, or more iterations than before, is a
+regression, and the script then lists them and exits with status 1. Wall
+times depend on the machine and are not compared.
+
+The generated LPs are Klee-Minty cubes, on which Dantzig's rule visits all
+2^n vertices, random sparse LPs with equality rows, so that phase 1 has
+work to do, and assignment problems, which are highly degenerate.
+"""
+import argparse
+import csv
+import json
+import sys
+
+import numpy as np
+
+from course_lps import INSTANCES, LP
+from revised_simplex import PRICINGS, compare_pricings
+
+COLUMNS = ["instance", "pricing", "status", "obj", "pivots", "phase1", "phase2", "degenerate", "time"]
+
+
+###
+# Generated LPs
+###
+
+def klee_minty(n):
+    """
+    The Klee-Minty cube in n dimensions,
+
+        max sum_j 2^(n-j) x_j  s.t.  2 sum_{j<i} 2^(i-j) x_j + x_i <= 5^i,  x >= 0,
+
+    whose optimum 5^n is at the last of the 2^n vertices Dantzig's rule visits.
+    """
+    i, j = np.indices((n, n))
+    A_ub = np.where(j < i, 2.0**(i - j + 1), 0.0) + np.eye(n)
+    c = 2.0**(n - 1 - np.arange(n))
+    b_ub = 5.0**(1 + np.arange(n))
+    return LP(c, A_ub, b_ub, np.zeros((0, n)), np.zeros(0), [(0, None)] * n, [f"x_{{{k+1}}}" for k in range(n)])
+
+
+def random_lp(m, n, seed, *, density=0.2, equalities=0.25):
+    """
+    A random sparse LP with m rows, a fraction of them equalities, and n
+    variables between 0 and 10. The right-hand sides are those of a random
+    point in the box, so the LP is feasible, and the box makes it bounded.
+    """
+    rng = np.random.default_rng(seed)
+    A = np.where(rng.random((m, n)) < density, rng.normal(size=(m, n)), 0.0)
+    x0 = rng.uniform(0, 10, n)
+    n_eq = int(equalities * m)
+    b_ub = A[n_eq:] @ x0 + rng.uniform(0, 5, m - n_eq)
+    c = rng.normal(size=n)
+    return LP(c, A[n_eq:], b_ub, A[:n_eq], A[:n_eq] @ x0, [(0, 10)] * n, [f"x_{{{k+1}}}" for k in range(n)])
+
+
+def assignment(n, seed):
+    """
+    A random n by n assignment problem, as a maximisation of minus the cost.
+    """
+    rng = np.random.default_rng(seed)
+    cost = rng.integers(1, 100, size=(n, n)).astype(float)
+    rows = np.kron(np.eye(n), np.ones(n))
+    columns = np.kron(np.ones(n), np.eye(n))
+    return LP(-cost.ravel(), np.zeros((0, n*n)), np.zeros(0), np.vstack([rows, columns]), np.ones(2*n),
+              [(0, None)] * (n*n), [f"x_{{{i+1}{j+1}}}" for i in range(n) for j in range(n)])
+
+
+CORPUS = dict(INSTANCES)
+CORPUS.update({f"klee_minty_{n}": lambda n=n: klee_minty(n) for n in (4, 7)})
+CORPUS.update({f"random_{m}x{n}_{seed}": lambda m=m, n=n, seed=seed: random_lp(m, n, seed)
+               for m, n in ((30, 50), (100, 150)) for seed in range(3)})
+CORPUS.update({f"assignment_{n}": lambda n=n: assignment(n, 0) for n in (8, 15)})
+
+
+def benchmark(names, pricings, *, repeat=1, refactor=50):
+    """
+    Runs compare_pricings on the LPs of CORPUS with the given names and
+    returns the results as a list of dicts with the keys of COLUMNS.
+    """
+    rows = []
+    for name in names:
+        lp = CORPUS[name]()
+        results = compare_pricings(lp.c, lp.A_ub, lp.b_ub, lp.A_eq, lp.b_eq, lp.bounds, pricings=pricings,
+                                   repeat=repeat, refactor=refactor)
+        rows += [{"instance": name, "pricing": pricing, **stats._asdict()} for pricing, stats in results.items()]
+    for row in rows:
+        row["obj"] = float(row["obj"])
+    return rows
+
+
+def cheapest(rows, instance):
+    """
+    Returns the name of the pricing rule that solved an instance in the
+    fewest iterations, then with the fewest degenerate ones, and otherwise
+    the first of those in rows.
+    """
+    rows = [r for r in rows if r["instance"] == instance and r["status"] == "optimal"]
+    return min(rows, key=lambda r: (r["pivots"], r["degenerate"]))["pricing"]
+
+
+def regressions(rows, baseline, *, rtol=1e-6):
+    """
+    Returns a message for every result that is worse than the row of the
+    same instance and pricing rule in baseline.
+    """
+    previous = {(r["instance"], r["pricing"]): r for r in baseline}
+    messages = []
+    for r in rows:
+        old = previous.get((r["instance"], r["pricing"]))
+        if old is None:
+            continue
+        where = f"{r['instance']} with {r['pricing']}"
+        if r["status"] != old["status"]:
+            messages.append(f"{where}: status {r['status']}, was {old['status']}")
+        elif abs(r["obj"] - old["obj"]) > rtol * (1 + abs(old["obj"])):
+            messages.append(f"{where}: objective {r['obj']:g}, was {old['obj']:g}")
+        if r["pivots"] > old["pivots"]:
+            messages.append(f"{where}: {r['pivots']} iterations, was {old['pivots']}")
+    return messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instance", nargs="+", choices=list(CORPUS), default=list(CORPUS))
+    parser.add_argument("--pricing", nargs="+", choices=list(PRICINGS), default=list(PRICINGS))
+    parser.add_argument("--refactor", type=int, default=50, help="pivots between refactorizations")
+    parser.add_argument("--repeat", type=int, default=1, help="time the best of this many runs")
+    parser.add_argument("--csv", help="also write the results to this file")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--baseline", help="compare with the results of an earlier --json run")
+    args = parser.parse_args()
+
+    rows = benchmark(args.instance, args.pricing, repeat=args.repeat, refactor=args.refactor)
+    rows.sort(key=lambda r: (args.instance.index(r["instance"]), r["pivots"], r["time"]))
+
+    print(f"{'instance':>18} {'pricing':>14} {'status':>10} {'pivots':>7} {'phase 1':>8} {'phase 2':>8} {'degen.':>7} {'time [s]':>9} {'obj':>12}")
+    for r in rows:
+        print(f"{r['instance']:>18} {r['pricing']:>14} {r['status']:>10} {r['pivots']:>7} {r['phase1']:>8} {r['phase2']:>8} {r['degenerate']:>7} "
+              f"{r['time']:>9.4f} {r['obj']:>12g}")
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(rows, fh, indent=1)
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            messages = regressions(rows, json.load(fh))
+        for message in messages:
+            print(message)
+        if messages:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+"""
+The revised primal simplex method with an LU-factorized basis, for tracing
+the pivots of LPs with hundreds of rows.
+
+    python revised_simplex.py factory_planning --pricing dantzig --csv trace.csv
+
+solves one of the LPs of course_lps.py and prints how many pivots each
+phase took, and --csv writes the trace of every pivot to a file.
+
+Instead of updating a whole tableau or dictionary, every pivot only solves
+two systems with the basis matrix B: B^T y = c_B for the prices and
+B alpha = a_q for the entering column. B is factorized as P L U once, and
+the pivots after that are kept in product form, as a file of eta matrices
+E_k with B_k^-1 = E_k ... E_1 B^-1. The factorization is recomputed from
+the current basis every refactor pivots, which keeps the eta file short and
+clears accumulated rounding errors.
+"""
+import argparse
+import csv
+import time
+from collections import namedtuple
+
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+
+Result = namedtuple("Result", ["status", "x", "obj", "basis", "trace"])
+Step = namedtuple("Step", ["phase", "entering", "leaving", "step", "obj", "degenerate", "basis"])
+Step.__doc__ = """
+One iteration of revised_simplex: the phase, the entering and leaving
+variables, with leaving None when the entering variable just moved to its
+other bound, the step length, the objective after it, whether the step was
+zero, and the basis after it.
+"""
+Stats = namedtuple("Stats", ["status", "obj", "pivots", "phase1", "phase2", "degenerate", "time"])
+Stats.__doc__ = """
+The effort of a run of revised_simplex: its status and objective, the
+iterations over both phases and in each, how many of them were degenerate,
+and the wall time in seconds.
+"""
+
+
+class ProductForm:
+    """
+    The inverse of a basis matrix as an LU factorization followed by an eta file.
+
+    Replacing the column in position r of B by a column with B^-1 a = alpha
+    multiplies B^-1 from the left by an eta matrix, the identity with column
+    r replaced by -alpha / alpha_r, apart from 1 / alpha_r at r. Only its
+    nonzeros are stored.
+    """
+
+    def __init__(self, M, basic):
+        self.M = M
+        self.factorize(basic)
+
+    def factorize(self, basic):
+        self.lu = lu_factor(self.M[:, basic])
+        self.etas = []
+
+    def ftran(self, v):
+        """
+        Returns B^-1 v, for a vector or a matrix v.
+        """
+        v = lu_solve(self.lu, v)
+        for r, index, values, pivot in self.etas:
+            vr = v[r]
+            v[index] += np.multiply.outer(values, vr)
+            v[r] = vr * pivot
+        return v
+
+    def btran(self, v):
+        """
+        Returns B^-T v.
+        """
+        v = np.array(v, dtype=float)
+        for r, index, values, pivot in reversed(self.etas):
+            v[r] = v[r] * pivot + values @ v[index]
+        return lu_solve(self.lu, v, trans=1)
+
+    def update(self, r, alpha):
+        """
+        Adds the eta matrix of a pivot in position r, where alpha is the entering column of the old basis.
+        """
+        index = np.flatnonzero(alpha)
+        index = index[index != r]
+        self.etas.append((r, index, -alpha[index] / alpha[r], 1 / alpha[r]))
+
+
+###
+# Pricing: pick the entering variable among the candidates with profitable reduced costs d
+###
+
+def dantzig(search, d, candidates):
+    """
+    The candidate with the largest reduced cost in absolute value.
+    """
+    return candidates[np.argmax(np.abs(d[candidates]))]
+
+def bland(search, d, candidates):
+    """
+    The candidate with the lowest index, which rules out cycling.
+    """
+    return candidates[0]
+
+class SteepestEdge:
+    """
+    The candidate with the largest d_j^2 / gamma_j, where gamma_j = 1 + ||B^-1 a_j||^2
+    is the squared length of its edge, so that the objective improves most
+    per unit of distance moved.
+
+    The lengths are computed once for the starting basis and then updated
+    exactly after every pivot with the recurrences of Goldfarb and Reid,
+    which take the pivot row and one more solve with B^T.
+    """
+
+    def __init__(self, search):
+        self.weights = 1 + (search.factor.ftran(search.M)**2).sum(axis=0)
+
+    def __call__(self, search, d, candidates):
+        return candidates[np.argmax(d[candidates]**2 / self.weights[candidates])]
+
+    def update(self, search, q, r, alpha):
+        ratio = search.pivot_row(r) / alpha[r]
+        w = search.factor.btran(alpha) @ search.M
+        gamma_q = 1 + alpha @ alpha
+        self.weights = np.maximum(self.weights - 2*ratio*w + ratio**2 * gamma_q, 1 + ratio**2)
+        self.weights[search.basic[r]] = max(gamma_q / alpha[r]**2, 1)
+
+class Devex:
+    """
+    Approximate steepest edge: the candidate with the largest d_j^2 / w_j,
+    where the reference weights w_j start at 1 and only grow, by the pivot
+    row, which avoids the extra solve of SteepestEdge.
+    """
+
+    def __init__(self, search):
+        self.weights = np.ones(search.M.shape[1])
+
+    def __call__(self, search, d, candidates):
+        return candidates[np.argmax(d[candidates]**2 / self.weights[candidates])]
+
+    def update(self, search, q, r, alpha):
+        ratio = search.pivot_row(r) / alpha[r]
+        w_q = self.weights[q]
+        self.weights = np.maximum(self.weights, ratio**2 * w_q)
+        self.weights[search.basic[r]] = max(w_q / alpha[r]**2, 1)
+
+PRICINGS = {
+    "dantzig": dantzig,
+    "bland": bland,
+    "devex": Devex,
+    "steepest_edge": SteepestEdge,
+}
+
+
+class RevisedSimplex:
+    """
+    The state of the revised simplex method on
+
+        max c^T x  s.t.  A_ub x <= b_ub,  A_eq x = b_eq,  lower <= x <= upper.
+
+    Every inequality gets a slack, and rows whose slack cannot start in the
+    basis an artificial variable. The columns of M are the variables, the
+    slacks and the artificials, in that order. Nonbasic variables sit at one
+    of their bounds, or at zero if they are free. Phase 1 minimises the sum
+    of the artificials and phase 2 maximises c^T x with the artificials
+    fixed at zero.
+
+    pricing is a name from PRICINGS or a function of the search, the reduced
+    costs and the candidates, like dantzig. A class, like Devex, is
+    instantiated with the search, and its update method is called with the
+    entering variable, the position of the leaving one and the entering
+    column before every change of basis.
+    """
+
+    def __init__(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, *,
+                 pricing="dantzig", refactor=50, tol=1e-9, max_pivots=100000):
+        c = np.asarray(c, dtype=float)
+        n = len(c)
+        A_ub = np.zeros((0, n)) if A_ub is None else np.asarray(A_ub, dtype=float).reshape(-1, n)
+        A_eq = np.zeros((0, n)) if A_eq is None else np.asarray(A_eq, dtype=float).reshape(-1, n)
+        b_ub = np.zeros(0) if b_ub is None else np.asarray(b_ub, dtype=float)
+        b_eq = np.zeros(0) if b_eq is None else np.asarray(b_eq, dtype=float)
+        if bounds is None:
+            bounds = [(0, None)] * n
+        m_ub, m_eq = len(A_ub), len(A_eq)
+        m = m_ub + m_eq
+        self.n = n
+        self.refactor = refactor
+        self.tol = tol
+        self.max_pivots = max_pivots
+
+        lower = np.array([-np.inf if l is None else l for l, _ in bounds], dtype=float)
+        upper = np.array([np.inf if u is None else u for _, u in bounds], dtype=float)
+        x = np.where(np.isfinite(lower), lower, np.where(np.isfinite(upper), upper, 0))
+        M = np.vstack([
+            np.hstack([A_ub, np.eye(m_ub)]),
+            np.hstack([A_eq, np.zeros((m_eq, m_ub))]),
+        ])
+        self.b = np.concatenate([b_ub, b_eq])
+        residual = self.b - M[:, :n] @ x
+
+        # Slacks of rows the starting point satisfies start in the basis, the other rows get artificials
+        slack_ok = np.zeros(m, dtype=bool)
+        slack_ok[:m_ub] = residual[:m_ub] >= 0
+        artificial = np.flatnonzero(~slack_ok)
+        columns = np.zeros((m, len(artificial)))
+        columns[artificial, np.arange(len(artificial))] = np.where(residual[artificial] >= 0, 1, -1)
+        self.M = np.hstack([M, columns])
+        self.first_artificial = n + m_ub
+        self.lower = np.concatenate([lower, np.zeros(m_ub + len(artificial))])
+        self.upper = np.concatenate([upper, np.full(m_ub + len(artificial), np.inf)])
+        self.x = np.concatenate([x, np.zeros(m_ub + len(artificial))])
+        self.c = np.concatenate([c, np.zeros(m_ub + len(artificial))])
+
+        self.basic = np.zeros(m, dtype=int)
+        self.basic[slack_ok] = n + np.flatnonzero(slack_ok)
+        self.basic[artificial] = self.first_artificial + np.arange(len(artificial))
+        self.x[self.basic] = np.abs(residual)
+        self.factor = ProductForm(self.M, self.basic)
+        self.trace = []
+        self.pricing = PRICINGS.get(pricing, pricing)
+        if isinstance(self.pricing, type):
+            self.pricing = self.pricing(self)
+
+    def refactorize(self):
+        """
+        Factorizes the current basis from scratch and recomputes the basic variables from the nonbasic ones.
+        """
+        self.factor.factorize(self.basic)
+        nonbasic = np.ones(len(self.x), dtype=bool)
+        nonbasic[self.basic] = False
+        self.x[self.basic] = self.factor.ftran(self.b - self.M[:, nonbasic] @ self.x[nonbasic])
+
+    def pivot_row(self, r):
+        """
+        Returns row r of B^-1 M.
+        """
+        e = np.zeros(len(self.basic))
+        e[r] = 1
+        return self.factor.btran(e) @ self.M
+
+    def candidates(self, d):
+        """
+        Returns the nonbasic variables whose move away from their bound would improve the objective.
+        """
+        up = (d > self.tol) & (self.x < self.upper - self.tol)
+        down = (d < -self.tol) & (self.x > self.lower + self.tol)
+        eligible = up | down
+        eligible[self.basic] = False
+        return np.flatnonzero(eligible)
+
+    def ratio_test(self, q, direction, alpha):
+        """
+        Returns the step length as x_q moves in direction, and the position
+        in the basis of the variable that blocks it, or None if x_q reaches
+        its other bound first. Near ties go to the largest |alpha|.
+        """
+        xb = self.x[self.basic]
+        rate = direction * alpha  # x_B decreases by rate * step
+        with np.errstate(divide="ignore", invalid="ignore"):
+            limit = np.where(
+                rate > self.tol, (xb - self.lower[self.basic]) / rate,
+                np.where(rate < -self.tol, (self.upper[self.basic] - xb) / -rate, np.inf)
+            )
+        limit = np.maximum(limit, 0)
+        step = limit.min(initial=np.inf)
+        flip = self.upper[q] - self.lower[q]
+        if flip <= step:
+            return flip, None
+        ties = np.flatnonzero(limit <= step + self.tol)
+        return step, ties[np.argmax(np.abs(alpha[ties]))]
+
+    def iterate(self, phase, cost):
+        """
+        Does one iteration with the given costs. Returns "optimal" if no
+        variable can improve the objective, "unbounded" if one can without
+        limit and None otherwise.
+        """
+        y = self.factor.btran(cost[self.basic])
+        d = cost - y @ self.M
+        candidates = self.candidates(d)
+        if len(candidates) == 0:
+            return "optimal"
+        q = self.pricing(self, d, candidates)
+        direction = 1 if d[q] > 0 else -1
+        alpha = self.factor.ftran(self.M[:, q])
+        step, r = self.ratio_test(q, direction, alpha)
+        if np.isinf(step):
+            return "unbounded"
+
+        self.x[q] += direction * step
+        self.x[self.basic] -= direction * step * alpha
+        leaving = None
+        if r is not None:
+            leaving = self.basic[r]
+            # The leaving variable stops exactly at the bound it hit
+            hit_lower = direction * alpha[r] > 0
+            self.x[leaving] = self.lower[leaving] if hit_lower else self.upper[leaving]
+            if hasattr(self.pricing, "update"):
+                self.pricing.update(self, q, r, alpha)
+            self.basic[r] = q
+            self.factor.update(r, alpha)
+            if len(self.factor.etas) >= self.refactor:
+                self.refactorize()
+        self.trace.append(Step(phase, q, leaving, step, cost @ self.x, step <= self.tol, self.basic.copy()))
+        return None
+
+    def solve_phase(self, phase, cost):
+        """
+        Iterates with the given costs until iterate returns a status, or "max_pivots".
+        """
+        while len(self.trace) < self.max_pivots:
+            status = self.iterate(phase, cost)
+            if status is not None:
+                return status
+        return "max_pivots"
+
+    def run(self):
+        """
+        Runs both phases and returns the Result. Its status is "optimal",
+        "infeasible", "unbounded" or "max_pivots", and x holds the original
+        variables only. The objective of the steps of phase 1 is minus the
+        sum of the artificials.
+        """
+        artificial = np.arange(len(self.x)) >= self.first_artificial
+        status = self.solve_phase(1, -artificial.astype(float))
+        if status == "optimal":
+            if self.x[artificial].sum() > self.tol * (1 + np.abs(self.b).max(initial=0)):
+                status = "infeasible"
+            else:
+                self.upper[artificial] = 0
+                status = self.solve_phase(2, self.c)
+        x = self.x[:self.n].copy()
+        return Result(status, x, self.c[:self.n] @ x, self.basic.copy(), self.trace)
+
+
+def revised_simplex(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, **kwargs):
+    """
+    Solves the LP with RevisedSimplex and returns the Result, whose trace has a Step for every iteration.
+
+    The keyword arguments are those of RevisedSimplex.
+    """
+    return RevisedSimplex(c, A_ub, b_ub, A_eq, b_eq, bounds, **kwargs).run()
+
+
+def run_stats(res, elapsed):
+    """
+    Returns the Stats of a Result that took elapsed seconds.
+    """
+    phases = [int(sum(step.phase == p for step in res.trace)) for p in (1, 2)]
+    degenerate = int(sum(step.degenerate for step in res.trace))
+    return Stats(res.status, res.obj, len(res.trace), phases[0], phases[1], degenerate, elapsed)
+
+
+def compare_pricings(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, *, pricings=PRICINGS, repeat=1, **kwargs):
+    """
+    Runs revised_simplex with every pricing rule and returns their Stats,
+    keyed by the name of the rule. The time is the best of repeat runs.
+    """
+    results = {}
+    for pricing in pricings:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            res = revised_simplex(c, A_ub, b_ub, A_eq, b_eq, bounds, pricing=pricing, **kwargs)
+            times.append(time.perf_counter() - start)
+        results[pricing] = run_stats(res, min(times))
+    return results
+
+
+COLUMNS = ["iteration", "phase", "entering", "leaving", "step", "obj", "degenerate"]
+
+
+def main():
+    from course_lps import INSTANCES
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("instance", choices=list(INSTANCES))
+    parser.add_argument("--pricing", choices=list(PRICINGS), default="dantzig")
+    parser.add_argument("--refactor", type=int, default=50, help="pivots between refactorizations")
+    parser.add_argument("--csv", help="write the trace to this file")
+    args = parser.parse_args()
+
+    lp = INSTANCES[args.instance]()
+    start = time.perf_counter()
+    res = revised_simplex(lp.c, lp.A_ub, lp.b_ub, lp.A_eq, lp.b_eq, lp.bounds, pricing=args.pricing, refactor=args.refactor)
+    stats = run_stats(res, time.perf_counter() - start)
+    print(f"{res.status}, objective {res.obj:g}")
+    print(f"{stats.phase1} + {stats.phase2} iterations ({stats.degenerate} degenerate) in {stats.time:.3f} s")
+
+    if args.csv:
+        names = lp.names + [f"slack_{i+1}" for i in range(len(lp.b_ub))]
+        name = lambda j: "" if j is None else names[j] if j < len(names) else f"artificial_{j - len(names) + 1}"
+        with open(args.csv, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=COLUMNS)
+            writer.writeheader()
+            for k, step in enumerate(res.trace):
+                writer.writerow({
+                    "iteration": k + 1, "phase": step.phase, "entering": name(step.entering), "leaving": name(step.leaving),
+                    "step": step.step, "obj": step.obj, "degenerate": step.degenerate
+                })
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,150 @@
 import numpy as np
 from manim import *
 
+from dictionary import ENTERING, dictionary_simplex, expression_parts, value_tex
+from narration import NarratedScene
+from polygons import clip_area, clip_sequence, polygon_mobject, polygon_vertices
+from pricing_benchmark import benchmark, cheapest
+from revised_simplex import PRICINGS
+from vertex_path import basis_vertices, path_mobject, path_points, walk_animations
+
 """
 Ideas:
 - Change the title at certain points/fade it out
 - label constraints with color (either the text or add small marker), and the lines accordingly as well
 """
 
-TEXT_FONT_SIZE = 32
-
-class SimplexGiapetto(MovingCameraScene):
-
-    def create_text(self, str):
+###
+# Problem data
+###
+c = np.array([3, 2])
+A = np.array([
+    [2, 1],
+    [1, 1],
+    [1, 0]
+])
+b = np.array([100, 80, 40])
+
+# The feasible region within the plotted range as the constraints are added in reverse order
+plot_box = polygon_vertices(np.zeros((0, 2)), [], upper=(90, 110))
+regions = clip_sequence(plot_box, A[::-1], b[::-1])
+
+# The dictionaries of the simplex method, generated exactly from the data above
+pivots, final = dictionary_simplex(c, A, b)
+dictionaries = [pivots[0].before if pivots else final] + [p.after for p in pivots]
+
+# The pricing rule of pricing_benchmark.py with the fewest pivots on this problem, Dantzig's on ties
+cheapest_rule = cheapest(benchmark(["giapetto"], [p for p in PRICINGS if p in ENTERING]), "giapetto")
+cheapest_pivots, _ = dictionary_simplex(c, A, b, entering=cheapest_rule)
+
+
+def route(path, other):
+    """
+    Describes how the walk along the vertices other goes from the start of
+    path to its end, compared to path, by the side of the line from start to
+    end that the first move of each walk turns to.
+    """
+    def turn(p):
+        moves = p[1:] - p[0]
+        moves = moves[np.linalg.norm(moves, axis=1) > 1e-9]
+        goal = p[-1] - p[0]
+        return np.sign(moves[0, 0]*goal[1] - moves[0, 1]*goal[0])
+
+    if turn(other) == 0:
+        return "goes straight along one edge"
+    if turn(other) == -turn(path):
+        return "goes the other way around"
+    return "goes the same way around, but visits fewer vertices"
+
+
+def dictionary_tex(names, objective, rows):
+    """
+    Creates the MathTex of a dictionary from the parts of expression_parts
+    for the objective and a list of (variable, parts) rows.
+
+    Every part is a separate tex string, so TransformMatchingTex can match
+    them. The returned mobject has the parts of the objective terms by
+    variable in terms, the left-hand sides of the rows by variable in lhs,
+    and the parts of every line in lines, under "z" for the objective, the
+    variable for the rows and "bounds" for the nonnegativity constraints.
+    """
+    strings = [r"\max~&", *[tex for _, tex in objective], r"\\", r"\mathop{\text{s.t.~}}"]
+    spans = {"z": (0, len(strings))}
+    for i, parts in rows:
+        start = len(strings)
+        strings += [f"&{names[i]}", "=", *[tex for _, tex in parts], r"\\"]
+        spans[i] = (start, len(strings))
+    strings.append(rf"&{names[0]},\dots,{names[-1]}\geq 0")
+    spans["bounds"] = (len(strings) - 1, len(strings))
+
+    tex = MathTex(*strings)
+    tex.lines = {key: VGroup(*tex[start:end]) for key, (start, end) in spans.items()}
+    tex.terms = {j: tex[1 + k] for k, (j, _) in enumerate(objective) if j is not None}
+    tex.lhs = {i: tex[spans[i][0]] for i, _ in rows}
+    return tex
+
+
+def dictionary_mobject(dictionary):
+    """
+    Creates the MathTex of a Dictionary.
+    """
+    names = dictionary.names
+    rows = [(i, expression_parts(row, names)) for i, row in dictionary.rows.items()]
+    return dictionary_tex(names, expression_parts(dictionary.objective, names), rows)
+
+
+def pivot_mobject(pivot, objective, rows, *, sort=True):
+    """
+    Creates the MathTex of a dictionary partway through a Pivot.
+
+    objective is "before", "substituted", with the entering variable
+    replaced by the parenthesised solved row, or "after". rows is "solved",
+    with only the row of the leaving variable solved for the entering one,
+    "substituted" or "after". The rows are ordered by variable, unless
+    sort=False keeps the solved row in the place of the leaving one.
+    """
+    before, after = pivot.before, pivot.after
+    names = before.names
+    replace = (pivot.entering, pivot.solved)
+    objective = {
+        "before": expression_parts(before.objective, names),
+        "substituted": expression_parts(before.objective, names, substitute=replace),
+        "after": expression_parts(after.objective, names),
+    }[objective]
+    lines = []
+    for i, row in before.rows.items():
+        if i == pivot.leaving:
+            lines.append((pivot.entering, expression_parts(pivot.solved, names)))
+        elif rows == "substituted":
+            lines.append((i, expression_parts(row, names, substitute=replace)))
+        elif rows == "after":
+            lines.append((i, expression_parts(after.rows[i], names)))
+        else:
+            lines.append((i, expression_parts(row, names)))
+    if sort:
+        lines.sort(key=lambda line: line[0])
+    return dictionary_tex(names, objective, lines)
+
+
+class SimplexGiapetto(NarratedScene, MovingCameraScene):
+
+    def transform_lines(self, source, target):
         """
-        Creates the text at the bottom left corner
+        Transforms every line of one dictionary_tex into the same line of another, and replaces source by target.
         """
-        text = Tex(str, font_size=TEXT_FONT_SIZE).to_corner(DL)
-        self.play(Write(text))
-        return text
+        self.play(*[Transform(source.lines[key], line) for key, line in target.lines.items()])
+        self.remove(source)
+        self.add(target)
 
-    def replace_text(self, text_mobj, str, *, wait=1.5, t2c=None):
+    def substitute(self, source, target, pivot, count):
         """
-        Transforms text_mobj to one with str, with some hardcoded settings
+        Moves count copies of the solved row of pivot from source into their
+        parentheses in target, where the other parts move to their matches.
         """
-        if type(str) == tuple:
-            tmp = Tex(*str, font_size=TEXT_FONT_SIZE).to_corner(DL)
-        else:    
-            tmp = Tex(str, font_size=TEXT_FONT_SIZE).to_corner(DL)
-        if t2c:
-            for k,v in t2c.items():
-                tmp.set_color_by_tex(k, v)
-        self.play(Transform(text_mobj, tmp))
-        self.remove(tmp)
-        self.wait(wait)
+        inner = "".join(tex for _, tex in expression_parts(pivot.solved, pivot.before.names))
+        moving = [MathTex(f"({inner})").move_to(source.lines[pivot.entering], RIGHT) for _ in range(count)]
+        self.play(TransformMatchingTex(VGroup(source, *moving), target))
+        self.remove(source, *moving)
 
     def construct(self):
         ###
@@ -128,12 +240,7 @@ class SimplexGiapetto(MovingCameraScene):
         ###
         # Highlight first quadrant
         ###
-        y_limit = ax.plot(lambda _: 110)
-        area = ax.get_area(
-            y_limit,
-            x_range=[0, 90],
-            opacity=0.5
-        )
+        area = polygon_mobject(ax, plot_box)
         self.play(DrawBorderThenFill(area))
 
         ###
@@ -163,8 +270,7 @@ class SimplexGiapetto(MovingCameraScene):
             color=BLUE
             )
         self.play(Create(c3))
-        new_width = np.abs(np.subtract(*ax.c2p([[0,0],[40,0]])[:,0]))  # calculate the actual distance between points 0 and 40 on the x-axis
-        self.play(area.animate.stretch_to_fit_width(new_width).align_to(c3, RIGHT))
+        clip_area(self, ax, area, regions[0])
         
         ###
         # Remove constraint highlight
@@ -185,14 +291,7 @@ class SimplexGiapetto(MovingCameraScene):
             color=BLUE
             )
         self.play(Create(c2))
-        temp = ax.get_area(
-            ax.plot(lambda x: 80-x),
-            x_range=[0,40],
-            opacity=0.5
-        )
-        # not sure how to make this smoother
-        self.play(Transform(area, temp))
-        self.remove(temp)
+        clip_area(self, ax, area, regions[1])
 
         ###
         # Remove constraint highlight
@@ -213,14 +312,7 @@ class SimplexGiapetto(MovingCameraScene):
             color=BLUE
             )
         self.play(Create(c1))
-        temp = ax.get_area(
-            ax.plot(lambda x: np.min([80-x, 100-2*x])),
-            x_range=[0,40],
-            opacity=0.5
-        )
-        # not sure how to make this smoother
-        self.play(Transform(area, temp))
-        self.remove(temp)
+        clip_area(self, ax, area, regions[2])
         
 
         ###
@@ -233,20 +325,14 @@ class SimplexGiapetto(MovingCameraScene):
         self.play(FadeOut(text))
         self.remove(text)
         self.wait()
-        text = self.create_text("There are 5 vertices that are possibly the optimum.")
+        vertex_coords = polygon_vertices(A, b)
+        text = self.create_text(f"There are {len(vertex_coords)} vertices that are possibly the optimum.")
         self.wait()
 
 
         ###
         # Label vertices
         ###
-        vertex_coords = [
-            [0,   0],
-            [40,  0],
-            [40, 20],
-            [20, 60],
-            [0,  80]
-        ]
         dots = [Dot(c, color=RED) for c in ax.c2p(vertex_coords)]
         for dot in dots:
             self.play(Create(dot), Flash(dot))
@@ -255,7 +341,7 @@ class SimplexGiapetto(MovingCameraScene):
 
         ###
         ###
-        self.replace_text(text, "With only 5 points, one could try bruteforcing.")
+        self.replace_text(text, f"With only {len(vertex_coords)} points, one could try bruteforcing.")
         self.replace_text(text, "But that is not feasible in larger problems.")
         self.replace_text(text, "We need a smarter solution.")
         self.replace_text(text, "The simplex algorithm offers a smart way of iterating through the vertices.")
@@ -319,13 +405,7 @@ class SimplexGiapetto(MovingCameraScene):
         # Rewrite: free variables
         ###
         self.replace_text(text, "We will also rewrite the constraints so that the slack variables are left alone.")
-        text_opt3 = MathTex(
-                       r"\max~&3x_1+2x_2 \\",
-                       r"\mathop{\text{s.t.~}}",r"&s_1= 100-2x_1-x_2 \\",
-                       r"&s_2 = 80-x_1-x_2 \\",
-                       r"&s_3 = 40-x_1 \\",
-                       r"&x_1,\dots,s_3\geq 0"
-                       )
+        text_opt3 = dictionary_mobject(dictionaries[0])
         text_opt3.save_state()
         tmp = VGroup(text_opt2, arrow, text_opt3).arrange().save_state()
         self.play(
@@ -337,9 +417,7 @@ class SimplexGiapetto(MovingCameraScene):
                 text_opt2[0][21:23],
                 text_opt2[0][33:35],
                 text_opt2[0][41:43],
-                text_opt3[2][0:2],
-                text_opt3[3][0:2],
-                text_opt3[4][0:2]
+                *text_opt3.lhs.values()
                 ), color=RED)
         )
         self.wait()
@@ -360,8 +438,7 @@ class SimplexGiapetto(MovingCameraScene):
         self.replace_text(text, ("We will rewrite the objective variables in terms of those in the ", "dictionary."), t2c={"dictionary":RED})
         self.play(FadeToColor(Group(
             text[0][16:34],
-            text_opt[0][4:6],
-            text_opt[0][8:10]
+            *text_opt.terms.values()
         ), color=YELLOW))
         self.wait()
 
@@ -381,218 +458,119 @@ class SimplexGiapetto(MovingCameraScene):
             text_opt.animate.to_edge(RIGHT)
         )
 
-        ###
-        # Pick x_1 to rewrite with s_3
-        ###
-        text = self.create_text("We need to pick which variable to rewrite.")
-        self.wait(2)
-        self.replace_text(text, "And also which constraint to rewrite with.")
-        self.replace_text(text, "Suppose we pick this pair.", wait=0.5)
-        self.play(
-            FadeToColor(text_opt[0][4:6], color=YELLOW),
-            FadeToColor(text_opt[4][0:2], color=RED)
-            )
-        self.wait()
-        
-        # rewrite constraint
-        tmp = MathTex(r"\max~&3{{x_1}}+2x_2 \\",
-                      r"\mathop{\text{s.t.~}}",
-                      r"&s_1= 100-2x_1-x_2 \\",
-                      r"&s_2 = 80-x_1-x_2 \\",
-                      r"&x_1 = 40-s_3 \\",
-                      r"&x_1,\dots,s_3\geq 0"
-                       ).move_to(text_opt)
-        self.play(TransformMatchingShapes(text_opt, tmp))
-        self.remove(text_opt)
-        text_opt = tmp
-        self.wait()
-
-        # Swap constraints
-        height = text_opt[4].get_y() - text_opt[5].get_y()
-        self.play(
-            text_opt[4].animate.shift(height*DOWN),
-            text_opt[5].animate.shift(height*DOWN),
-            text_opt[6].animate.shift(2*height*UP)
-        )
-        self.wait()
-
-        # Substitute
-        target = MathTex(r"\max~&", r"3{{(40-s_3)}}+2x_2 \\",
-                         r"\mathop{\text{s.t.~}}",
-                         r"&x_1 = 40-s_3 \\",
-                         r"&s_1= 100-2{{x_1}}-x_2 \\",
-                         r"&s_2 = 80-{{x_1}}-x_2 \\",
-                         r"&x_1,\dots,s_3\geq 0").move_to(text_opt)
-        moving = MathTex("{{(40-s_3)}}").move_to(text_opt[6], RIGHT)
-        self.play(TransformMatchingTex(VGroup(text_opt, moving), target))
-        self.remove(text_opt, moving)
-        text_opt = target
-        self.wait(1)
-
-        # Expand
-        tmp = MathTex(r"120+2x_2-3s_3 \\").move_to(text_opt[3], UR)
-        self.play(Transform(Group(*text_opt[1:4]), tmp))
-        self.remove(tmp)
-
-        self.replace_text(text, "Since the new variable has a negative sign, we want to set it to zero.")
-        self.replace_text(text, "Doing so means, by the first constraint, that $x_1$ is equal to 40.")
-        self.replace_text(text, "So we have moved from this point ...")
-        self.play(Flash(dots[0]))
-        self.replace_text(text, "... to this point.")
-        self.play(Flash(dots[1]))
-
-        # Substitute
-        ## Awkward animation here
-        self.replace_text(text, "We substitute the remaining $x_1$s here...")
-        target = MathTex(r"\max~&120+2x_2-3s_3 \\",
-                         r"\mathop{\text{s.t.~}}",
-                         r"&x_1 = 40-s_3 \\",
-                         r"&s_1 =", r"100-2{{(40-s_3)}}-x_2 \\",
-                         r"&s_2 =", r"80-{{(40-s_3)}}-x_2 \\",
-                         r"&x_1,\dots,s_3\geq 0").to_edge(RIGHT)
-        self.play(text_opt.animate.align_to(target, UL))
-        moving = MathTex("{{(40-s_3)}}").move_to(text_opt[5], RIGHT)
-        self.play(TransformMatchingTex(VGroup(text_opt, moving), target))
-        self.remove(text_opt, moving)
-        text_opt = target
-        self.wait()
-
-        # Expand
-        tmp1 = MathTex(r"20-x_2+2s_3 \\").align_to(text_opt[4], UL)
-        tmp2 = MathTex(r"40-x_2+s_3 \\").align_to(text_opt[8], UL)
-        self.play(
-            Transform(Group(*text_opt[4:7]), tmp1),
-            Transform(Group(*text_opt[8:11]), tmp2)
-            )
-        self.remove(tmp1, tmp2)
-        self.play(text_opt.animate.to_edge(RIGHT))
-
-        ###
-        # Pick x_2 to rewrite with x_1
-        ###
-        self.replace_text(text, "The objective still contains variables without a negative sign.")
-        self.replace_text(text, "So we continue similarly.")
-        self.replace_text(text, "Let's pick these two.")
-        self.play(
-            FadeToColor(text_opt[0][8:10], color=YELLOW),
-            FadeToColor(text_opt[3][0:2], color=RED)
-            )
-        self.wait()
-        
-        # Rewrite constraint
-        ## Awkward
-        tmp = MathTex(r"&x_2 = 20-s_1+2s_3 \\").move_to(text_opt[3], LEFT)
-        self.play(Transform(Group(*text_opt[3:7]), tmp))
-        self.wait()
-
-        # Substitute
-        target = MathTex(r"\max~&", "120+2", "{{(20-s_1+2s_3)}}", r"-3s_3 \\",
-                         r"\mathop{\text{s.t.~}}",
-                         r"&x_1 = 40-s_3 \\",
-                         r"&x_2 = 20-s_1+2s_3 \\",
-                         r"&s_2 = 40-{{x_2}}+s_3 \\",
-                         r"&x_1,\dots,s_3\geq 0").to_edge(RIGHT)
-        self.play(text_opt.animate.align_to(target, UL))
-        moving = MathTex("{{(20-s_1+2s_3)}}").move_to(text_opt[5], RIGHT)
-        self.play(TransformMatchingTex(VGroup(text_opt, moving), target))
-        text_opt = target
-        self.wait()
-
-        # Expand
-        tmp = MathTex(r"160-2s_1+s_3 \\").move_to(text_opt[1], UL)
-        self.play(Transform(Group(*text_opt[1:4]), tmp))
-        self.play(text_opt.animate.to_edge(RIGHT))
-
-        self.replace_text(text, "Doing so, we move from here ...")
-        self.play(Flash(dots[1]))
-        self.replace_text(text, "... to here.")
-        self.play(Flash(dots[2]))
-
-        # Substitute
-        ## Awkward animation here
-        self.replace_text(text, "We substitute the remaining $x_2$ ...")
-        target = MathTex(r"\max~&160-2s_1+{{s_3}} \\",
-                         r"\mathop{\text{s.t.~}}",
-                         r"&x_1 = 40-s_3 \\",
-                         r"&x_2 = 20-s_1+2s_3 \\",
-                         r"&s_2 =", r"40-{{(20-s_1+2s_3)}}+s_3 \\",
-                         r"&x_1,\dots,s_3\geq 0").to_edge(RIGHT)
-        self.play(text_opt.animate.align_to(target, UL))
-        moving = MathTex("{{(20-s_1+2s_3)}}").move_to(text_opt[6], RIGHT)
-        self.play(TransformMatchingTex(VGroup(text_opt, moving), target))
-        text_opt = target
-        self.wait()
-
-        # Expand
-        tmp = MathTex(r"20+s_1-s_3 \\").align_to(text_opt[7], UL)
-        self.play(Transform(Group(*text_opt[7:10]), tmp))
-        self.play(text_opt.animate.to_edge(RIGHT))
-
-        ###
-        # Pick s_3 to rewrite with s_2
-        ###
-        self.replace_text(text, "Now, these two.")
-        self.play(
-            FadeToColor(text_opt[1][0:2], color=YELLOW),
-            FadeToColor(text_opt[6][0:2], color=RED)
-            )
-        
-        # Rewrite constraint
-        ## Awkward
-        tmp = MathTex(r"&s_3 = 20+s_1-s_2 \\").move_to(text_opt[6], LEFT)
-        self.play(Transform(VGroup(*text_opt[6:10]), tmp))
-        self.wait()
-
-        # Substitute
-        target = MathTex(r"\max~&{{160-2s_1+}}{{(20+s_1-s_2)}} \\",
-                         r"\mathop{\text{s.t.~}}",
-                         r"&x_1 = 40-s_3 \\",
-                         r"&x_2 = 20-s_1+2{{s_3}} \\",
-                         r"&s_3 = 20+s_1-s_2 \\",
-                         r"&x_1,\dots,s_3\geq 0").to_edge(RIGHT)
-        self.play(text_opt.animate.align_to(target, UL))
-        moving = MathTex("{{(20+s_1-s_2)}}").move_to(text_opt[7], RIGHT)
-        self.play(TransformMatchingTex(VGroup(text_opt, moving), target))
-        text_opt = target
-        self.wait()
-
-        # Expand
-        tmp = MathTex(r"180-s_1-s_2 \\").move_to(text_opt[1], UL)
-        self.play(Transform(Group(*text_opt[1:4]), tmp))
-        self.play(text_opt.animate.to_edge(RIGHT))
-
-        # Substitute
-        self.replace_text(text, "Substitute the remaining $s_3$ ...")
-        target = MathTex(r"\max~&180-s_1-s_2 \\",
-                         r"\mathop{\text{s.t.~}}",
-                         r"&x_1 = 40-s_3 \\",
-                         r"&x_2 = {{20-s_1+2}}{{(20+s_1-s_2)}} \\",
-                         r"&s_3 = 20+s_1-s_2 \\",
-                         r"&x_1,\dots,s_3\geq 0").to_edge(RIGHT)
-        self.play(text_opt.animate.align_to(target, UL))
-        moving = MathTex("{{(20+s_1-s_2)}}").move_to(text_opt[5], RIGHT)
-        self.play(TransformMatchingTex(VGroup(text_opt, moving), target))
-        text_opt = target
-        self.wait()
-
-        # Expand
-        tmp = MathTex(r"60+s_1-2s_2 \\").align_to(text_opt[4], UL)
-        self.play(Transform(Group(*text_opt[4:7]), tmp))
-        self.play(text_opt.animate.to_edge(RIGHT))
-
+        # The vertex of every dictionary
+        vertices = basis_vertices(A, b, [d.basic for d in dictionaries])
+        path = path_points(ax, vertices)
+        walker = Dot(path[0], color=YELLOW)
+        self.play(FadeIn(walker))
+
+        for k, pivot in enumerate(pivots):
+            names = pivot.before.names
+            entering = names[pivot.entering]
+
+            ###
+            # Pick the entering and leaving variables
+            ###
+            if k == 0:
+                text = self.create_text("We need to pick which variable to rewrite.")
+                self.wait(2)
+                self.replace_text(text, "And also which constraint to rewrite with.")
+                self.replace_text(text, "Suppose we pick this pair.", wait=0.5)
+            elif k == 1:
+                self.replace_text(text, "The objective still contains variables without a negative sign.")
+                self.replace_text(text, "So we continue similarly.")
+                self.replace_text(text, "Let's pick these two.")
+            else:
+                self.replace_text(text, "Now, these two.")
+            self.play(
+                FadeToColor(text_opt.terms[pivot.entering], color=YELLOW),
+                FadeToColor(text_opt.lhs[pivot.leaving], color=RED)
+                )
+            self.wait()
+
+            # Rewrite constraint
+            target = pivot_mobject(pivot, "before", "solved", sort=False).to_edge(RIGHT)
+            self.play(TransformMatchingShapes(text_opt, target))
+            self.remove(text_opt)
+            text_opt = target
+            self.wait()
+
+            # Move it to its place among the rows
+            target = pivot_mobject(pivot, "before", "solved").to_edge(RIGHT)
+            if list(target.lines) != list(text_opt.lines):
+                self.transform_lines(text_opt, target)
+                text_opt = target
+                self.wait()
+
+            # Substitute into the objective
+            target = pivot_mobject(pivot, "substituted", "solved").to_edge(RIGHT)
+            self.substitute(text_opt, target, pivot, 1)
+            text_opt = target
+            self.wait(1)
+
+            # Expand
+            target = pivot_mobject(pivot, "after", "solved").to_edge(RIGHT)
+            self.transform_lines(text_opt, target)
+            text_opt = target
+
+            value = pivot.after.rows[pivot.entering].constant
+            if k == 0:
+                self.replace_text(text, "Since the new variable has a negative sign, we want to set it to zero.")
+                self.replace_text(text, f"Doing so means, by the rewritten constraint, that ${entering}$ is equal to ${value_tex(value)}$.")
+                self.replace_text(text, "So we have moved from this point ...")
+                self.play(Flash(path[k]))
+                self.replace_text(text, "... to this point.")
+            else:
+                self.replace_text(text, "Doing so, we move from here ...")
+                self.play(Flash(path[k]))
+                self.replace_text(text, "... to here.")
+            # A degenerate pivot stays at the same vertex and gives no move
+            for move in walk_animations(walker, ax, vertices[k:k+2]):
+                self.play(move)
+            self.play(Flash(path[k+1]))
+
+            if not pivot.substituted:
+                continue
+
+            # Substitute into the other rows
+            self.replace_text(text, f"We substitute the remaining ${entering}$ ...")
+            target = pivot_mobject(pivot, "after", "substituted").to_edge(RIGHT)
+            self.substitute(text_opt, target, pivot, len(pivot.substituted))
+            text_opt = target
+            self.wait()
+
+            # Expand
+            target = pivot_mobject(pivot, "after", "after").to_edge(RIGHT)
+            self.transform_lines(text_opt, target)
+            text_opt = target
+
+        ###
+        # Read off the optimum
+        ###
+        names = final.names
+        values = final.values()
         self.replace_text(text, "Now, the objective contains only negative signs.")
-        self.replace_text(text, "So we can infer that the maximum value is 180.")
-        self.replace_text(text, "Setting the objective variables to zero, we see that $x_1=40$.")
+        self.replace_text(text, f"So we can infer that the maximum value is ${value_tex(final.objective.constant)}$.")
         text_opt.save_state()
-        self.play(FadeToColor(text_opt[2], color=YELLOW))
-        self.play(Restore(text_opt))
-        self.replace_text(text, "And $x_2=60$.")
-        self.play(FadeToColor(Group(text_opt[3:5]), color=YELLOW))
-        self.play(Restore(text_opt))
-        self.replace_text(text, "We move from here ...")
-        self.play(Flash(dots[2]))
-        self.replace_text(text, "... to here.")
-        self.play(Flash(dots[3]))
-
+        for j in range(len(c)):
+            if j == 0:
+                self.replace_text(text, f"Setting the objective variables to zero, we see that ${names[j]}={value_tex(values[j])}$.")
+            else:
+                self.replace_text(text, f"And ${names[j]}={value_tex(values[j])}$.")
+            if j in final.rows:
+                self.play(FadeToColor(text_opt.lines[j], color=YELLOW))
+                self.play(Restore(text_opt))
+
+        ###
+        # The cheapest path
+        ###
+        if len(cheapest_pivots) < len(pivots):
+            bases = [cheapest_pivots[0].before.basic] + [p.after.basic for p in cheapest_pivots]
+            cheapest_path = basis_vertices(A, b, bases)
+            rule = cheapest_rule.replace("_", " ")
+            self.replace_text(text, f"We always picked the largest coefficient, which took {len(pivots)} pivots.")
+            self.replace_text(text, f"With {rule} pricing, the algorithm {route(vertices, cheapest_path)} ...", wait=0.5)
+            self.play(Create(path_mobject(ax, cheapest_path)), *[Flash(p) for p in path_points(ax, cheapest_path)])
+            self.replace_text(text, f"... and reaches the optimum in {len(cheapest_pivots)} pivots.")
 
         self.wait(5)
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+Tidy drawing of search trees, for laying out the nodes of a branch-and-bound log.
+
+tidy_layout places the nodes with the Reingold-Tilford algorithm in the
+linear time version of Buchheim, Juenger and Leipert (2002), which extends
+Walker's algorithm: parents are centred above their children, subtrees are
+pushed apart just enough that their contours keep a minimum distance, and
+identical subtrees are drawn identically. Both walks over the tree are
+iterative, so deep trees do not hit the recursion limit.
+"""
+import numpy as np
+
+
+def parents_of(log):
+    """
+    Returns the parent of every node of a log, a list of Nodes or a NodePool, with -1 for the root.
+    """
+    if hasattr(log, "parent"):
+        return log.parent[:len(log)].astype(int)
+    return np.array([-1 if n.parent is None else n.parent for n in log], dtype=int)
+
+
+def tidy_layout(parents, *, distance=1.0):
+    """
+    Returns the horizontal position and the depth of every node of a tree.
+
+    parents[i] is the parent of node i, and -1 (or None) for the root.
+    Children are placed from left to right in the order of their ids, and
+    neighbouring nodes on the same level are at least distance apart. The
+    root is at x = 0.
+    """
+    parents = [-1 if p is None or p < 0 else int(p) for p in parents]
+    N = len(parents)
+    if N == 0:
+        return np.zeros(0), np.zeros(0, dtype=int)
+    children = [[] for _ in range(N)]
+    root = None
+    for i, p in enumerate(parents):
+        if p < 0:
+            root = i
+        else:
+            children[p].append(i)
+    number = [0] * N           # Position among siblings, starting from 1
+    for kids in children:
+        for k, w in enumerate(kids):
+            number[w] = k + 1
+
+    prelim = [0.0] * N
+    mod = [0.0] * N
+    shift = [0.0] * N
+    change = [0.0] * N
+    thread = [-1] * N
+    ancestor = list(range(N))
+    default_ancestor = [kids[0] if kids else -1 for kids in children]
+
+    def left_sibling(v):
+        p = parents[v]
+        return children[p][number[v] - 2] if p >= 0 and number[v] > 1 else -1
+
+    def next_left(v):
+        return children[v][0] if children[v] else thread[v]
+
+    def next_right(v):
+        return children[v][-1] if children[v] else thread[v]
+
+    def move_subtree(wl, wr, s):
+        subtrees = number[wr] - number[wl]
+        change[wr] -= s / subtrees
+        shift[wr] += s
+        change[wl] += s / subtrees
+        prelim[wr] += s
+        mod[wr] += s
+
+    def apportion(v):
+        # Push the subtree of v right until it clears those of its left siblings
+        w = left_sibling(v)
+        if w < 0:
+            return
+        p = parents[v]
+        vir = vor = v
+        vil = w
+        vol = children[p][0]
+        sir = sor = mod[v]
+        sil = mod[vil]
+        sol = mod[vol]
+        while next_right(vil) >= 0 and next_left(vir) >= 0:
+            vil = next_right(vil)
+            vir = next_left(vir)
+            vol = next_left(vol)
+            vor = next_right(vor)
+            ancestor[vor] = v
+            s = (prelim[vil] + sil) - (prelim[vir] + sir) + distance
+            if s > 0:
+                a = ancestor[vil] if parents[ancestor[vil]] == p else default_ancestor[p]
+                move_subtree(a, v, s)
+                sir += s
+                sor += s
+            sil += mod[vil]
+            sir += mod[vir]
+            sol += mod[vol]
+            sor += mod[vor]
+        if next_right(vil) >= 0 and next_right(vor) < 0:
+            thread[vor] = next_right(vil)
+            mod[vor] += sil - sor
+        if next_left(vir) >= 0 and next_left(vol) < 0:
+            thread[vol] = next_left(vir)
+            mod[vol] += sir - sol
+            default_ancestor[p] = v
+
+    # First walk, in post-order: preliminary positions relative to the parent
+    order = []
+    stack = [root]
+    while stack:
+        v = stack.pop()
+        order.append(v)
+        stack.extend(children[v])
+    for v in reversed(order):
+        w = left_sibling(v)
+        if children[v]:
+            s = c = 0.0
+            for k in reversed(children[v]):
+                prelim[k] += s
+                mod[k] += s
+                c += change[k]
+                s += shift[k] + c
+            midpoint = (prelim[children[v][0]] + prelim[children[v][-1]]) / 2
+            if w >= 0:
+                prelim[v] = prelim[w] + distance
+                mod[v] = prelim[v] - midpoint
+            else:
+                prelim[v] = midpoint
+        elif w >= 0:
+            prelim[v] = prelim[w] + distance
+        apportion(v)
+
+    # Second walk, in pre-order: add up the modifiers of the ancestors
+    x = np.zeros(N)
+    depth = np.zeros(N, dtype=int)
+    offset = [0.0] * N
+    for v in order:
+        p = parents[v]
+        if p >= 0:
+            offset[v] = offset[p] + mod[p]
+            depth[v] = depth[p] + 1
+        x[v] = prelim[v] + offset[v]
+    return x - x[root], depth
+
+
+def fit_layout(x, depth, node_width, node_height, box_width, box_height, center=(0, 0, 0), *, spacing=(1.2, 1.8), uniform=True):
+    """
+    Maps a layout into a box of the given size around center, with the root on top.
+
+    Neighbouring slots are spacing times the node size apart. If the tree
+    does not fit at full size, everything is shrunk by the same factor, or
+    with uniform=False, each axis by its own factor, which suits trees drawn
+    as dots. Returns the scene points of the nodes as an (n, 3) array, and
+    the factor by which the nodes have to be scaled, the smaller of the two
+    if they differ.
+    """
+    x = np.asarray(x, dtype=float)
+    depth = np.asarray(depth)
+    slot_width = spacing[0] * node_width
+    slot_height = spacing[1] * node_height
+    span = x.max() - x.min()
+    levels = depth.max()
+    scale_x = min(1.0, box_width / (span*slot_width + node_width))
+    scale_y = min(1.0, box_height / (levels*slot_height + node_height))
+    if uniform:
+        scale_x = scale_y = min(scale_x, scale_y)
+    points = np.zeros((len(x), 3))
+    points[:, 0] = (x - (x.min() + x.max()) / 2) * slot_width * scale_x
+    points[:, 1] = (levels / 2 - depth) * slot_height * scale_y
+    return points + np.asarray(center, dtype=float), min(scale_x, scale_y)
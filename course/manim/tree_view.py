@@ -0,0 +1,93 @@
+"""
+Level-of-detail drawing of large search trees.
+
+Drawing each node of a tree as a Circle with a MathTex costs a LaTeX run and
+an SVG parse per node, which is fine for the handful of nodes the BNB scene
+narrates but not for trees of hundreds of nodes. tree_mobject only gives
+full labels to highlighted nodes. All other nodes are instances of one dot
+glyph, which are stamped out with NumPy and merged into one VMobject per
+status, and all edges form a single VMobject as well, so the cost of a
+tree does not grow with the number of LaTeX compilations.
+"""
+import numpy as np
+
+from manim import GREEN, GREY, RED, WHITE, YELLOW, Circle, MathTex, VGroup, VMobject
+
+STATUS_COLORS = {
+    None: WHITE,
+    "branched": WHITE,
+    "integer": GREEN,
+    "pruned": GREY,
+    "infeasible": RED,
+}
+
+
+def line_points(starts, ends):
+    """
+    Returns the Bezier control points of straight segments from starts to ends, all in one array.
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    t = np.array([0, 1/3, 2/3, 1])[np.newaxis, :, np.newaxis]
+    return (starts[:, np.newaxis] + t * (ends - starts)[:, np.newaxis]).reshape(-1, 3)
+
+
+def glyph_points(glyph, centers, scale=1.0):
+    """
+    Returns the points of copies of glyph, scaled and centred at every one of centers, as one array.
+    """
+    template = (glyph.points - glyph.get_center()) * scale
+    centers = np.asarray(centers, dtype=float)
+    return (template[np.newaxis] + centers[:, np.newaxis]).reshape(-1, 3)
+
+
+def default_label(node, point, radius):
+    """
+    A circle with the id of node, used for highlighted nodes unless tree_mobject is given another label.
+    """
+    circle = Circle(radius=radius, color=YELLOW).move_to(point)
+    return VGroup(circle, MathTex(f"P_{{{node.id}}}", font_size=64*radius).move_to(circle))
+
+
+def tree_mobject(log, points, *, radius=0.1, highlight=(), detail_depth=None, label=default_label, stroke_width=1):
+    """
+    Draws the tree of log with its nodes at points, as returned by fit_layout.
+
+    Nodes whose ids are in highlight get a full label, label(node, point,
+    radius), which should create the mobject of the node at point. Every
+    other node becomes a dot coloured by its status: pruned and infeasible
+    nodes and nodes deeper than detail_depth get small dots, and the
+    remaining ones dots of the given radius. Returns a VGroup of the edges,
+    the dots by status and the labels, in that order, so that labels are
+    drawn on top. The returned group has the labels by node id in the
+    attribute labels.
+    """
+    points = np.asarray(points, dtype=float)
+    highlight = set(highlight)
+
+    children = [n for n in log if n.parent is not None]
+    edges = VMobject(stroke_width=stroke_width, stroke_color=GREY)
+    if children:
+        edges.set_points(line_points(points[[n.parent for n in children]], points[[n.id for n in children]]))
+
+    glyph = Circle(radius=1)
+    dots = VGroup()
+    for status, color in STATUS_COLORS.items():
+        nodes = [n for n in log if n.status == status and n.id not in highlight]
+        if not nodes:
+            continue
+        small = np.array([
+            n.status in ("pruned", "infeasible") or (detail_depth is not None and n.depth > detail_depth)
+            for n in nodes
+        ])
+        ids = np.array([n.id for n in nodes])
+        for mask, r in ((~small, radius), (small, radius / 2)):
+            if mask.any():
+                dot = VMobject(stroke_width=0, fill_color=color, fill_opacity=1)
+                dot.set_points(glyph_points(glyph, points[ids[mask]], r))
+                dots.add(dot)
+
+    labels = {i: label(log[i], points[i], radius) for i in sorted(highlight)}
+    tree = VGroup(edges, dots, VGroup(*labels.values()))
+    tree.labels = labels
+    return tree
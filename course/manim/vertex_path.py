@@ -0,0 +1,74 @@
+"""
+Helpers for showing the walk of the simplex method along the vertices of a
+feasible region in two or three variables.
+
+A pivot log, such as the dictionaries of dictionary.py or the trace of
+revised_simplex.py, is a sequence of bases of
+
+    A x + s = b,  x, s >= 0,
+
+each a list of the indices of the basic variables, with x first and the
+slacks s after them. basis_vertices turns the whole sequence into the
+vertices the bases stand for at once, so a scene needs no coordinates but
+the problem data.
+"""
+import numpy as np
+
+from manim import YELLOW, VMobject
+
+
+def basis_vertices(A, b, bases):
+    """
+    Returns the vertex of every basis of a pivot log as a (len(bases), n) array.
+
+    The basic variables of all bases are solved for in one batched call of
+    np.linalg.solve, with the nonbasic variables at zero, and the slacks are
+    dropped. Degenerate bases of the same vertex give the same point.
+    Raises ValueError if a basis has the wrong size, an index that is neither
+    a variable nor a slack, such as that of an artificial variable, or a
+    singular basis matrix.
+    """
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    b = np.asarray(b, dtype=float)
+    m, n = A.shape
+    bases = np.asarray(bases, dtype=int).reshape(-1, m)
+    if np.any((bases < 0) | (bases >= n + m)):
+        raise ValueError("A basis of the log has an index that is neither a variable nor a slack")
+
+    M = np.hstack([A, np.eye(m)])
+    # B[k] is the basis matrix of bases[k]
+    B = M[:, bases].transpose(1, 0, 2)
+    try:
+        values = np.linalg.solve(B, np.broadcast_to(b, (len(bases), m))[..., np.newaxis])[..., 0]
+    except np.linalg.LinAlgError:
+        raise ValueError("A basis of the log is singular") from None
+    z = np.zeros((len(bases), n + m))
+    np.put_along_axis(z, bases, values, axis=1)
+    return z[:, :n]
+
+
+def path_points(ax, vertices):
+    """
+    Returns the scene points of vertices, in the coordinates of ax, which
+    are Axes for two variables and ThreeDAxes for three.
+    """
+    return np.atleast_2d(ax.c2p(np.asarray(vertices, dtype=float)))
+
+
+def path_mobject(ax, vertices, *, color=YELLOW, **kwargs):
+    """
+    Creates the polyline along the vertices of a walk, in the coordinates of ax.
+    """
+    return VMobject(color=color, **kwargs).set_points_as_corners(path_points(ax, vertices))
+
+
+def walk_animations(dot, ax, vertices, **kwargs):
+    """
+    Returns the animations moving dot from vertex to vertex along the walk,
+    one per pivot, skipping degenerate pivots that stay at the same vertex.
+    The keyword arguments are passed on to every animation.
+    """
+    points = path_points(ax, vertices)
+    moves = np.flatnonzero(np.linalg.norm(np.diff(points, axis=0), axis=1) > 1e-9) + 1
+    return [dot.animate(**kwargs).move_to(points[k]) for k in moves]
+